@@ -129,7 +129,7 @@ def print_result(result: dict, dry_run: bool) -> None:
         print(f"    - No cache files found")
 
     if result["state_cleared"]:
-        print(f"    ✓ State: cleared from processed.json")
+        print(f"    ✓ State: cleared from processed.jsonl")
     else:
         print(f"    - No state entry found")
 
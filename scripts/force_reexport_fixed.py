@@ -18,6 +18,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.sheets import get_sheets_client, get_sheet_id, export_to_sheets
+from src.summarizer import load_env
 from src.state import get_state_manager
 from src.podcast_db import get_episodes_since
 
@@ -80,6 +81,9 @@ def main():
                         help="Show what would be deleted/exported without making changes")
     args = parser.parse_args()
 
+    # Read .env before the state manager looks up PODCASTWISE_OUTPUT_DIR
+    load_env()
+
     if args.dry_run:
         print("=== DRY RUN MODE ===\n")
 
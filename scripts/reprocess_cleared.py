@@ -15,7 +15,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.podcast_db import get_episodes_since
 from src.pipeline import run_pipeline, print_pipeline_summary
-from src.summarizer import DEFAULT_MODEL
+from src.summarizer import get_default_model, load_env
 
 
 # Episode IDs for each phase
@@ -54,12 +54,16 @@ def main():
                         help="Preview without processing")
     parser.add_argument("--phase", choices=["1", "3", "4", "all"], default="all",
                         help="Which phase to process (1=Stratechery, 3=YouTube, 4=Feb2026, all=all)")
-    parser.add_argument("--model", default=DEFAULT_MODEL,
-                        help=f"Model to use (default: {DEFAULT_MODEL})")
+    parser.add_argument("--model", default=None,
+                        help="Model to use (default: DEFAULT_MODEL from .env, else sonnet)")
     parser.add_argument("--no-rate-limit", action="store_true",
                         help="Disable rate limiting")
     args = parser.parse_args()
 
+    # Read .env before the pipeline looks up PODCASTWISE_OUTPUT_DIR or API keys
+    load_env()
+    args.model = args.model or get_default_model()
+
     # Build target ID set
     target_ids = set()
     if args.phase in ("1", "all"):
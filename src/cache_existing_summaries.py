@@ -11,7 +11,7 @@ from pathlib import Path
 from rich.console import Console
 
 from .state import get_state_manager
-from .sheets import get_summary_cache_dir, cache_summary
+from .sheets import cache_summary, is_summary_cached
 from .summarizer import PodcastSummary
 
 
@@ -164,8 +164,8 @@ def cache_existing_summaries() -> dict:
 
     # Get all successfully processed episodes
     processed = [
-        ep for ep in state.list_processed()
-        if ep.status == "success" and ep.output_file
+        ep for ep in state.list_processed(status="success")
+        if ep.output_file
     ]
 
     if not processed:
@@ -174,18 +174,13 @@ def cache_existing_summaries() -> dict:
 
     console.print(f"[cyan]Found {len(processed)} processed episodes in state[/cyan]")
 
-    # Ensure cache directory exists
-    summary_cache_dir = get_summary_cache_dir()
-    summary_cache_dir.mkdir(parents=True, exist_ok=True)
-
     cached = 0
     skipped = 0
     errors = 0
 
     for proc_ep in processed:
         # Check if already cached
-        cache_file = summary_cache_dir / f"{proc_ep.episode_id}.json"
-        if cache_file.exists():
+        if is_summary_cached(proc_ep.episode_id):
             skipped += 1
             continue
 
@@ -233,6 +228,9 @@ def cache_existing_summaries() -> dict:
 
 
 if __name__ == "__main__":
+    from .summarizer import load_env
+    load_env()
+
     console.print("[bold]Caching existing summaries from markdown files...[/bold]\n")
 
     result = cache_existing_summaries()
@@ -22,7 +22,7 @@ from rich.console import Console
 from .podcast_db import get_episodes_since, get_episode_count_by_podcast, Episode
 from .state import get_state_manager
 from .sheets import export_to_sheets, cleanup_all_sheets, sync_export_state
-from .summarizer import get_available_models, DEFAULT_MODEL, MODEL_CONFIG
+from .summarizer import get_available_models, get_default_model, load_env, MODEL_CONFIG
 from .youtube import (
     extract_cookies, has_cookies, set_cookie_file, DEFAULT_BROWSER,
     load_not_found, clear_not_found_matching, get_not_found_count
@@ -295,7 +295,7 @@ def cmd_sync_export_state(args):
 def cmd_youtube(args):
     """Summarize a standalone YouTube video (no Apple Podcasts required)."""
     from .youtube import fetch_transcript_for_url, extract_video_id
-    from .summarizer import summarize_youtube_video, DEFAULT_MODEL
+    from .summarizer import summarize_youtube_video
     from .markdown import write_youtube_summary
     from .sheets import export_youtube_to_sheets, cache_summary_for_youtube
 
@@ -324,7 +324,7 @@ def cmd_youtube(args):
     console.print(f"[dim]Transcript: {len(transcript_text):,} characters[/dim]")
 
     # Get model to use
-    model = args.model or DEFAULT_MODEL
+    model = args.model or get_default_model()
     console.print(f"\n[cyan]Generating summary with {model}...[/cyan]")
 
     try:
@@ -333,6 +333,7 @@ def cmd_youtube(args):
             transcript_text,
             model=model,
             rate_limit=not args.no_rate_limit,
+            use_cache=not args.force,
         )
     except Exception as e:
         console.print(f"[red]Error generating summary: {e}[/red]")
@@ -431,7 +432,7 @@ def check_stratechery_cookies(selected_episodes: list[Episode]) -> bool:
 def cmd_run(args):
     """Main interactive mode: select episodes and run pipeline."""
     from .selector import select_episodes, display_selection_summary, confirm_selection
-    from .pipeline import run_pipeline, print_pipeline_summary
+    from .pipeline import run_pipeline, print_pipeline_summary, MAX_WORKERS
 
     console.print("\n[bold]Podcastwise - Podcast Summarizer[/bold]")
     console.print("[dim]Fetching episodes from Apple Podcasts...[/dim]\n")
@@ -498,7 +499,7 @@ def cmd_run(args):
         console.print("\n[cyan]AUTO-SYNC - Will export to Google Sheets after processing[/cyan]")
 
     # Show model being used
-    model = args.model or DEFAULT_MODEL
+    model = args.model or get_default_model()
     console.print(f"\n[dim]Model: {model}[/dim]")
 
     # Show cookie status
@@ -545,6 +546,7 @@ def cmd_run(args):
         model=model,
         overwrite=args.overwrite,
         youtube_url=args.youtube_url,
+        max_workers=args.workers or MAX_WORKERS,
     )
 
     print_pipeline_summary(results)
@@ -669,6 +671,13 @@ Examples:
         action='store_true',
         help='Disable rate limiting (faster but may hit API limits)'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Number of episodes to process concurrently (default: 4)'
+    )
     parser.add_argument(
         '--overwrite',
         action='store_true',
@@ -735,6 +744,9 @@ Examples:
 
     args = parser.parse_args()
 
+    # Read .env before any command looks up PODCASTWISE_OUTPUT_DIR or API keys
+    load_env()
+
     # Route to appropriate command
     if args.refresh_cookies:
         browser = args.browser or DEFAULT_BROWSER
@@ -774,7 +786,7 @@ Examples:
             console.print("4. Copy the file to: ~/Documents/PodcastNotes/.cache/transcripts/stratechery_cookies.txt")
     elif args.list_models:
         console.print("\n[bold]Available Models[/bold]\n")
-        console.print(f"[dim]Default: {DEFAULT_MODEL}[/dim]\n")
+        console.print(f"[dim]Default: {get_default_model()}[/dim]\n")
         console.print("[bold]Anthropic (direct API):[/bold]")
         for alias, (provider, model_id) in MODEL_CONFIG.items():
             if provider == "anthropic":
@@ -5,11 +5,13 @@ Orchestrates the full workflow: selection -> transcripts -> summarization -> mar
 """
 
 import json
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.table import Table
 
@@ -29,6 +31,14 @@ from .sheets import cache_summary
 
 console = Console()
 
+# Episodes processed concurrently. LLM calls still go through the summarizer's
+# shared rate limiter, so this mostly overlaps transcript fetches and I/O.
+MAX_WORKERS = 4
+
+# Transcript fetches run ahead of summarization on their own pool so network
+# latency is hidden behind LLM calls.
+PREFETCH_WORKERS = 8
+
 
 @dataclass
 class PipelineResult:
@@ -50,6 +60,7 @@ def run_pipeline(
     model: str = None,
     overwrite: bool = False,
     youtube_url: str = None,
+    max_workers: int = MAX_WORKERS,
 ) -> list[PipelineResult]:
     """
     Run the full summarization pipeline on selected episodes.
@@ -62,6 +73,7 @@ def run_pipeline(
         model: Model alias (e.g., 'sonnet', 'haiku', 'gpt-4o')
         overwrite: If True, overwrite existing markdown files. If False, skip if exists.
         youtube_url: Optional YouTube URL to use instead of searching (only valid for single episode)
+        max_workers: Number of episodes to process concurrently
 
     Returns:
         List of PipelineResult objects
@@ -81,13 +93,13 @@ def run_pipeline(
     to_process = []
     for ep in episodes:
         # Check if already processed
-        if not force and state.is_processed(ep.id):
-            processed = state.get_processed(ep.id)
+        processed = None if force else state.get_processed(ep.id)
+        if processed is not None:
             if processed.status == "success":
                 results.append(PipelineResult(
                     episode=ep,
                     status="skipped",
-                    output_file=Path(processed.output_file) if processed.output_file else None,
+                    output_file=state.get_output_path(ep.id),
                 ))
                 continue
             elif processed.status == "no_transcript" and not retry_no_transcript:
@@ -127,15 +139,68 @@ def run_pipeline(
     ) as progress:
         task = progress.add_task("Processing...", total=len(to_process))
 
-        for ep in to_process:
-            progress.update(task, description=f"[cyan]{ep.podcast_name[:25]}[/cyan]")
+        prefetch_executor = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS)
+        prefetched = prewarm_transcripts(to_process, prefetch_executor, youtube_url)
+
+        executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+        futures = {
+            executor.submit(
+                _process_single_episode,
+                ep, state, retry_no_transcript, rate_limit, model, overwrite, youtube_url, force,
+                prefetched[ep.id],
+            ): i
+            for i, ep in enumerate(to_process)
+        }
+        completed: dict[int, PipelineResult] = {}
+
+        try:
+            for future in progress.track(as_completed(futures), total=len(futures), task_id=task):
+                result = future.result()
+                completed[futures[future]] = result
+                progress.update(task, description=f"[cyan]{result.episode.podcast_name[:25]}[/cyan]")
+        except KeyboardInterrupt:
+            console.print("\n[yellow]Interrupted - waiting for in-flight episodes to finish...[/yellow]")
+            raise
+        finally:
+            # If we stopped early for any reason, drop queued episodes so no new
+            # LLM calls start; in-flight ones finish and record their state.
+            stopped_early = len(completed) < len(futures)
+            executor.shutdown(wait=True, cancel_futures=stopped_early)
+            prefetch_executor.shutdown(wait=not stopped_early, cancel_futures=stopped_early)
+
+    # Keep results in selection order regardless of completion order
+    results.extend(completed[i] for i in sorted(completed))
 
-            result = _process_single_episode(ep, state, retry_no_transcript, rate_limit, model, overwrite, youtube_url)
-            results.append(result)
+    return results
 
-            progress.advance(task)
 
-    return results
+def prewarm_transcripts(
+    episodes: list[Episode],
+    executor: ThreadPoolExecutor,
+    youtube_url: str = None,
+) -> dict[int, Future]:
+    """
+    Start fetching transcripts for all episodes in the background.
+
+    Each future resolves to the transcript (or None). Fetched transcripts
+    land in the on-disk cache, so the main loop overlaps fetching episode
+    K+1..K+N with summarizing episode K.
+
+    Args:
+        episodes: Episodes about to be processed
+        executor: Pool to run the fetches on
+        youtube_url: Optional YouTube URL override (single-episode runs)
+
+    Returns:
+        Dict of episode ID -> Future
+    """
+    prefetched = {}
+    for ep in episodes:
+        if ep.id not in prefetched:
+            prefetched[ep.id] = executor.submit(
+                fetch_transcript_for_episode, ep, use_cache=True, youtube_url=youtube_url
+            )
+    return prefetched
 
 
 def _process_single_episode(
@@ -146,6 +211,8 @@ def _process_single_episode(
     model: str = None,
     overwrite: bool = False,
     youtube_url: str = None,
+    force: bool = False,
+    prefetched: Optional[Future] = None,
 ) -> PipelineResult:
     """Process a single episode through the full pipeline."""
 
@@ -154,7 +221,10 @@ def _process_single_episode(
         if retry_no_transcript:
             clear_not_found(episode.id)
 
-        transcript = fetch_transcript_for_episode(episode, use_cache=True, youtube_url=youtube_url)
+        if prefetched is not None:
+            transcript = prefetched.result()
+        else:
+            transcript = fetch_transcript_for_episode(episode, use_cache=True, youtube_url=youtube_url)
 
         if not transcript:
             # Mark as no transcript
@@ -171,7 +241,9 @@ def _process_single_episode(
             )
 
         # Step 2: Summarize with LLM
-        summary = summarize_transcript(episode, transcript, model=model, rate_limit=rate_limit)
+        summary = summarize_transcript(
+            episode, transcript, model=model, rate_limit=rate_limit, use_cache=not force,
+        )
 
         # Step 2.5: Cache summary for later export
         cache_summary(episode.id, summary)
@@ -215,49 +287,54 @@ def _process_single_episode(
 def print_pipeline_summary(results: list[PipelineResult]) -> None:
     """Print a summary of pipeline results."""
 
-    success = [r for r in results if r.status == "success"]
-    skipped = [r for r in results if r.status == "skipped"]
-    no_transcript = [r for r in results if r.status == "no_transcript"]
-    errors = [r for r in results if r.status == "error"]
+    counts = Counter(r.status for r in results)
 
-    console.print("\n" + "=" * 60)
-    console.print("[bold]Pipeline Summary[/bold]")
-    console.print("=" * 60)
+    # Collect the whole block and render it with a single print call
+    lines: list = [
+        "\n" + "=" * 60,
+        "[bold]Pipeline Summary[/bold]",
+        "=" * 60,
+    ]
 
     # Stats table
     table = Table(show_header=False, box=None)
     table.add_column(style="bold")
     table.add_column(justify="right")
 
-    table.add_row("[green]✓ Summarized[/green]", str(len(success)))
-    table.add_row("[blue]⟳ Skipped (already done)[/blue]", str(len(skipped)))
-    table.add_row("[yellow]✗ No transcript[/yellow]", str(len(no_transcript)))
-    table.add_row("[red]⚠ Errors[/red]", str(len(errors)))
+    table.add_row("[green]✓ Summarized[/green]", str(counts["success"]))
+    table.add_row("[blue]⟳ Skipped (already done)[/blue]", str(counts["skipped"]))
+    table.add_row("[yellow]✗ No transcript[/yellow]", str(counts["no_transcript"]))
+    table.add_row("[red]⚠ Errors[/red]", str(counts["error"]))
     table.add_row("", "")
     table.add_row("[bold]Total[/bold]", str(len(results)))
 
-    console.print(table)
+    lines.append(table)
 
     # Show successful outputs
-    if success:
-        console.print("\n[green]Generated files:[/green]")
-        for r in success:
-            console.print(f"  {r.output_file}")
+    if counts["success"]:
+        lines.append("\n[green]Generated files:[/green]")
+        lines.extend(f"  {r.output_file}" for r in results if r.status == "success")
 
     # Show no transcript episodes
-    if no_transcript:
-        console.print("\n[yellow]No transcript available:[/yellow]")
-        for r in no_transcript:
-            console.print(f"  - {r.episode.podcast_name}: {r.episode.title[:40]}...")
+    if counts["no_transcript"]:
+        lines.append("\n[yellow]No transcript available:[/yellow]")
+        lines.extend(
+            f"  - {r.episode.podcast_name}: {r.episode.title[:40]}..."
+            for r in results if r.status == "no_transcript"
+        )
 
     # Show errors
-    if errors:
-        console.print("\n[red]Errors:[/red]")
-        for r in errors:
-            console.print(f"  - {r.episode.title[:40]}: {r.error_message}")
+    if counts["error"]:
+        lines.append("\n[red]Errors:[/red]")
+        lines.extend(
+            f"  - {r.episode.title[:40]}: {r.error_message}"
+            for r in results if r.status == "error"
+        )
 
     # Output directory
-    console.print(f"\n[dim]Output directory: {get_output_dir()}[/dim]")
+    lines.append(f"\n[dim]Output directory: {get_output_dir()}[/dim]")
+
+    console.print(Group(*lines))
 
 
 def show_processing_status() -> None:
@@ -265,20 +342,24 @@ def show_processing_status() -> None:
     state = get_state_manager()
     stats = state.get_stats()
 
-    console.print("\n[bold]Processing Status[/bold]")
-    console.print("=" * 40)
-    console.print(f"Total processed:    {stats['total']}")
-    console.print(f"  Successful:       {stats['success']}")
-    console.print(f"  No transcript:    {stats['no_transcript']}")
-    console.print(f"  Errors:           {stats['errors']}")
+    lines = [
+        "\n[bold]Processing Status[/bold]",
+        "=" * 40,
+        f"Total processed:    {stats['total']}",
+        f"  Successful:       {stats['success']}",
+        f"  No transcript:    {stats['no_transcript']}",
+        f"  Errors:           {stats['errors']}",
+    ]
 
     # Show recent
     recent = state.list_processed()[:5]
     if recent:
-        console.print("\n[bold]Recent:[/bold]")
+        lines.append("\n[bold]Recent:[/bold]")
         for ep in recent:
             status_icon = "✓" if ep.status == "success" else "✗" if ep.status == "error" else "?"
-            console.print(f"  {status_icon} {ep.podcast_name[:25]}: {ep.episode_title[:35]}...")
+            lines.append(f"  {status_icon} {ep.podcast_name[:25]}: {ep.episode_title[:35]}...")
+
+    console.print(Group(*lines))
 
 
 def run_pipeline_with_progress(
@@ -313,13 +394,13 @@ def run_pipeline_with_progress(
     # First pass: filter episodes
     to_process = []
     for ep in episodes:
-        if not force and state.is_processed(ep.id):
-            processed = state.get_processed(ep.id)
+        processed = None if force else state.get_processed(ep.id)
+        if processed is not None:
             if processed.status == "success":
                 results.append(PipelineResult(
                     episode=ep,
                     status="skipped",
-                    output_file=Path(processed.output_file) if processed.output_file else None,
+                    output_file=state.get_output_path(ep.id),
                 ))
                 continue
             elif processed.status == "no_transcript" and not retry_no_transcript:
@@ -350,6 +431,7 @@ def run_pipeline_with_progress(
             retry_no_transcript=retry_no_transcript,
             rate_limit=rate_limit,
             model=model,
+            force=force,
             progress_callback=lambda step, pct: emit({
                 'type': 'progress',
                 'step': step,
@@ -379,6 +461,7 @@ def _process_single_episode_with_progress(
     rate_limit: bool = True,
     model: str = None,
     progress_callback=None,
+    force: bool = False,
 ) -> PipelineResult:
     """Process a single episode with step progress callbacks."""
 
@@ -412,7 +495,9 @@ def _process_single_episode_with_progress(
 
         # Step 2: Summarize
         emit("Generating summary with LLM...", 40)
-        summary = summarize_transcript(episode, transcript, model=model, rate_limit=rate_limit)
+        summary = summarize_transcript(
+            episode, transcript, model=model, rate_limit=rate_limit, use_cache=not force,
+        )
         emit("Summary generated", 70)
 
         # Step 2.5: Cache summary
@@ -460,6 +545,8 @@ def _process_single_episode_with_progress(
 if __name__ == "__main__":
     # Test with a few episodes
     from .podcast_db import get_episodes_since
+    from .summarizer import load_env
+    load_env()
 
     episodes = get_episodes_since()[:3]
 
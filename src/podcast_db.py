@@ -4,7 +4,9 @@ Apple Podcasts database extraction module.
 Reads podcast listening history from the macOS Apple Podcasts SQLite database.
 """
 
+import json
 import sqlite3
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -88,6 +90,59 @@ class Episode:
         return f"{progress}%"
 
 
+_EPISODES_SINCE_QUERY = """
+SELECT
+    e.Z_PK as id,
+    e.ZTITLE as episode_title,
+    p.ZTITLE as podcast_name,
+    p.ZAUTHOR as podcast_author,
+    COALESCE(e.ZDURATION, 0) as duration,
+    COALESCE(e.ZPLAYHEAD, 0) as playhead,
+    e.ZLASTDATEPLAYED as date_played,
+    e.ZPUBDATE as date_published,
+    p.ZFEEDURL as feed_url,
+    e.ZGUID as guid,
+    e.ZITEMDESCRIPTIONWITHOUTHTML as description
+FROM ZMTEPISODE e
+JOIN ZMTPODCAST p ON e.ZPODCAST = p.Z_PK
+WHERE e.ZLASTDATEPLAYED IS NOT NULL
+  AND e.ZLASTDATEPLAYED >= ?{filters}
+ORDER BY e.ZLASTDATEPLAYED DESC
+"""
+
+# Matches Episode.podcast_name, which maps a missing title to "Unknown Podcast"
+_PODCAST_NAME_FILTER = "COALESCE(NULLIF(p.ZTITLE, ''), 'Unknown Podcast') = ?"
+
+_EPISODE_COUNT_QUERY = """
+SELECT p.ZTITLE as podcast_name, COUNT(*) as count
+FROM ZMTEPISODE e
+JOIN ZMTPODCAST p ON e.ZPODCAST = p.Z_PK
+WHERE e.ZLASTDATEPLAYED IS NOT NULL
+  AND e.ZLASTDATEPLAYED >= ?
+GROUP BY p.ZTITLE
+ORDER BY count DESC
+"""
+
+
+# Per-thread connections to the Podcasts database. sqlite3 caches compiled
+# statements per connection keyed by SQL text, so reusing the connection lets
+# repeat queries skip parsing and planning.
+_local = threading.local()
+
+
+def _get_connection(db_path: Path) -> sqlite3.Connection:
+    """Get this thread's connection to db_path, opening it on first use."""
+    connections = getattr(_local, "connections", None)
+    if connections is None:
+        connections = _local.connections = {}
+    conn = connections.get(db_path)
+    if conn is None:
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row
+        connections[db_path] = conn
+    return conn
+
+
 def core_data_to_datetime(ts: Optional[float]) -> Optional[datetime]:
     """Convert Core Data timestamp to Python datetime."""
     if ts is None or ts <= 0:
@@ -98,7 +153,10 @@ def core_data_to_datetime(ts: Optional[float]) -> Optional[datetime]:
 
 def get_episodes_since(
     since_date: datetime = datetime(2025, 1, 1),
-    db_path: Path = DB_PATH
+    db_path: Path = DB_PATH,
+    *,
+    podcast_name: Optional[str] = None,
+    episode_ids: Optional[list[int]] = None,
 ) -> list[Episode]:
     """
     Fetch all episodes played since the given date.
@@ -106,6 +164,8 @@ def get_episodes_since(
     Args:
         since_date: Earliest date to include (default: Jan 1, 2025)
         db_path: Path to Apple Podcasts database
+        podcast_name: Only include episodes of this podcast
+        episode_ids: Only include episodes with these IDs
 
     Returns:
         List of Episode objects, sorted by date played (most recent first)
@@ -116,32 +176,22 @@ def get_episodes_since(
     # Convert since_date to Core Data timestamp
     since_ts = since_date.timestamp() - CORE_DATA_EPOCH_OFFSET
 
-    query = """
-    SELECT
-        e.Z_PK as id,
-        e.ZTITLE as episode_title,
-        p.ZTITLE as podcast_name,
-        p.ZAUTHOR as podcast_author,
-        COALESCE(e.ZDURATION, 0) as duration,
-        COALESCE(e.ZPLAYHEAD, 0) as playhead,
-        e.ZLASTDATEPLAYED as date_played,
-        e.ZPUBDATE as date_published,
-        p.ZFEEDURL as feed_url,
-        e.ZGUID as guid,
-        e.ZITEMDESCRIPTIONWITHOUTHTML as description
-    FROM ZMTEPISODE e
-    JOIN ZMTPODCAST p ON e.ZPODCAST = p.Z_PK
-    WHERE e.ZLASTDATEPLAYED IS NOT NULL
-      AND e.ZLASTDATEPLAYED >= ?
-    ORDER BY e.ZLASTDATEPLAYED DESC
-    """
+    # Filters are applied in SQL so only matching rows are read and built
+    filters = ""
+    params: list = [since_ts]
+    if podcast_name is not None:
+        filters += f"\n  AND {_PODCAST_NAME_FILTER}"
+        params.append(podcast_name)
+    if episode_ids is not None:
+        # One JSON parameter: no host-parameter limit, and stable SQL text
+        # so the connection's statement cache still hits
+        filters += "\n  AND e.Z_PK IN (SELECT value FROM json_each(?))"
+        params.append(json.dumps(list(episode_ids)))
 
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
+    conn = _get_connection(db_path)
 
     episodes = []
-    for row in cursor.execute(query, (since_ts,)):
+    for row in conn.execute(_EPISODES_SINCE_QUERY.format(filters=filters), params):
         episode = Episode(
             id=row['id'],
             title=row['episode_title'] or "Untitled",
@@ -157,7 +207,6 @@ def get_episodes_since(
         )
         episodes.append(episode)
 
-    conn.close()
     return episodes
 
 
@@ -171,23 +220,9 @@ def get_episode_count_by_podcast(
 
     since_ts = since_date.timestamp() - CORE_DATA_EPOCH_OFFSET
 
-    query = """
-    SELECT p.ZTITLE as podcast_name, COUNT(*) as count
-    FROM ZMTEPISODE e
-    JOIN ZMTPODCAST p ON e.ZPODCAST = p.Z_PK
-    WHERE e.ZLASTDATEPLAYED IS NOT NULL
-      AND e.ZLASTDATEPLAYED >= ?
-    GROUP BY p.ZTITLE
-    ORDER BY count DESC
-    """
-
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    result = {row[0]: row[1] for row in cursor.execute(query, (since_ts,))}
+    conn = _get_connection(db_path)
 
-    conn.close()
-    return result
+    return {row[0]: row[1] for row in conn.execute(_EPISODE_COUNT_QUERY, (since_ts,))}
 
 
 if __name__ == "__main__":
@@ -61,7 +61,7 @@ def process_episodes(
     ) as progress:
         task = progress.add_task("Fetching transcripts...", total=len(episodes))
 
-        for episode in episodes:
+        for episode in progress.track(episodes, task_id=task):
             progress.update(task, description=f"[cyan]{episode.podcast_name[:25]}[/cyan]")
 
             # Check if previously marked as not found
@@ -72,7 +72,6 @@ def process_episodes(
                     status="not_found",
                     error_message="Previously marked as not found",
                 ))
-                progress.advance(task)
                 continue
 
             # Clear not_found status if retrying
@@ -89,7 +88,6 @@ def process_episodes(
                             transcript=cached,
                             status="cached",
                         ))
-                        progress.advance(task)
                         continue
 
                 # Fetch from YouTube
@@ -118,8 +116,6 @@ def process_episodes(
                     error_message=str(e),
                 ))
 
-            progress.advance(task)
-
     return results
 
 
@@ -168,6 +164,8 @@ def get_successful_transcripts(results: list[ProcessingResult]) -> list[tuple[Ep
 
 if __name__ == "__main__":
     from .podcast_db import get_episodes_since
+    from .summarizer import load_env
+    load_env()
 
     # Test with a few episodes
     episodes = get_episodes_since()[:5]
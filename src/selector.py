@@ -59,8 +59,9 @@ def select_episodes(episodes: list[Episode]) -> list[Episode]:
     # Group by date for better organization
     current_date = None
 
-    # Count processed episodes
+    # Count processed and partial episodes in the same pass that builds choices
     processed_count = 0
+    partial_count = 0
 
     for i, ep in enumerate(episodes):
         ep_date = ep.date_played.strftime('%Y-%m-%d') if ep.date_played else "Unknown"
@@ -70,6 +71,8 @@ def select_episodes(episodes: list[Episode]) -> list[Episode]:
         is_summarized = processed_record is not None and processed_record.status == "success"
         if is_summarized:
             processed_count += 1
+        if ep.is_partial:
+            partial_count += 1
 
         # Add date separator when date changes
         if ep_date != current_date:
@@ -91,7 +94,6 @@ def select_episodes(episodes: list[Episode]) -> list[Episode]:
     console.print("[dim]Ctrl+A to select all, Ctrl+R to clear all[/dim]\n")
 
     # Show episode count
-    partial_count = sum(1 for ep in episodes if ep.is_partial)
     console.print(f"[dim]Showing {len(episodes)} episodes ({len(episodes) - partial_count} complete, {partial_count} partial, {processed_count} already summarized)[/dim]")
     console.print("[dim]Episodes marked [done] have already been processed[/dim]\n")
 
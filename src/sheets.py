@@ -6,26 +6,33 @@ Exports successfully summarized episodes to a Google Sheet organized by year.
 
 import json
 import os
+import threading
+import time
+from collections import defaultdict, deque
 from dataclasses import asdict
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from dotenv import load_dotenv
 from rich.console import Console
 
 from .podcast_db import Episode
-from .summarizer import PodcastSummary
+from .summarizer import PodcastSummary, load_env
 from .state import get_state_manager, ProcessedEpisode
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-# Load environment variables
-load_dotenv()
 
 console = Console()
 
+
 def get_summary_cache_dir() -> Path:
     """Get summary cache directory, evaluated at runtime."""
+    load_env()
     base = Path(os.getenv("PODCASTWISE_OUTPUT_DIR", "~/Documents/PodcastNotes")).expanduser()
     return base / ".cache/summaries"
 
@@ -39,12 +46,15 @@ def get_sheets_client():
     try:
         import gspread
         from google.oauth2.service_account import Credentials
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
     except ImportError:
         raise ImportError(
             "Google Sheets dependencies not installed. Run:\n"
             "pip install gspread google-auth"
         )
 
+    load_env()
     creds_path = os.getenv("GOOGLE_SHEETS_CREDENTIALS")
     if not creds_path:
         raise ValueError(
@@ -62,11 +72,82 @@ def get_sheets_client():
     ]
 
     credentials = Credentials.from_service_account_file(str(creds_path), scopes=scopes)
-    return gspread.authorize(credentials)
+    client = gspread.authorize(credentials)
+
+    # Reuse keep-alive connections and back off on quota errors (429).
+    # Only 429s and connection failures are retried: the request never reached
+    # the sheet, so retrying non-idempotent POSTs (appends, row deletes) is safe.
+    retry = Retry(
+        total=5,
+        read=0,
+        backoff_factor=1.5,
+        status_forcelist=[429],
+        allowed_methods=None,  # Retry POSTs too (all Sheets writes are POST)
+        respect_retry_after_header=True,
+        raise_on_status=False,  # Let gspread raise APIError once retries run out
+    )
+    client.http_client.session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry),
+    )
+    return client
+
+
+# --- Write Rate Limiting ---
+
+# Sheets allows 60 write requests per minute per user; stay a little under it
+SHEETS_WRITES_PER_MINUTE = 55
+SHEETS_WRITE_ATTEMPTS = 5
+
+_write_times: deque = deque()  # Times of writes in the last 60 seconds
+_write_rate_lock = threading.Lock()
+
+
+def _apply_write_rate_limit() -> None:
+    """Wait if needed so writes stay under SHEETS_WRITES_PER_MINUTE (sliding window)."""
+    with _write_rate_lock:
+        current_time = time.monotonic()
+        while _write_times and current_time - _write_times[0] >= 60:
+            _write_times.popleft()
+
+        if len(_write_times) >= SHEETS_WRITES_PER_MINUTE:
+            time.sleep(60 - (current_time - _write_times[0]))
+            _write_times.popleft()
+
+        _write_times.append(time.monotonic())
+
+
+def _sheets_write(fn, *args, idempotent: bool = False, **kwargs):
+    """
+    Make a Sheets write request under the write rate limit.
+
+    Idempotent writes (value updates to fixed ranges) are also retried with
+    exponential backoff on transient 5xx errors. 429s are retried for every
+    request by the transport adapter set up in get_sheets_client().
+
+    Args:
+        fn: gspread method to call
+        idempotent: Whether repeating the request is safe
+
+    Returns:
+        Whatever fn returns
+    """
+    for attempt in range(SHEETS_WRITE_ATTEMPTS):
+        _apply_write_rate_limit()
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            status = getattr(getattr(e, "response", None), "status_code", None)
+            if not idempotent or status not in (500, 502, 503, 504):
+                raise
+            if attempt == SHEETS_WRITE_ATTEMPTS - 1:
+                raise
+            time.sleep(min(60, 2 ** attempt))
 
 
 def get_sheet_id() -> str:
     """Get the Google Sheet ID from environment."""
+    load_env()
     sheet_id = os.getenv("GOOGLE_SHEET_ID")
     if not sheet_id:
         raise ValueError(
@@ -78,26 +159,130 @@ def get_sheet_id() -> str:
 
 # --- Summary Cache Functions ---
 
+# Summaries are appended to a single JSONL file (one {"id": ..., **summary}
+# record per line; the last record for an id wins) and served from an
+# in-memory index, instead of one small JSON file per episode.
+_summary_index: dict[str, dict] = {}
+_summary_index_path: Optional[Path] = None
+_summary_index_offset = 0
+_summary_index_lock = threading.Lock()
+
+
+def get_summary_index_file() -> Path:
+    """Get the append-only summary cache file, evaluated at runtime."""
+    return get_summary_cache_dir() / "summaries.jsonl"
+
+
+def _dumps_record(record: dict) -> bytes:
+    """Serialize one summary cache record as a JSONL line (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return (json.dumps(record) + "\n").encode("utf-8")
+
+
+def _loads_record(raw: bytes) -> dict:
+    """Parse one summary cache record (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _load_index() -> dict[str, dict]:
+    """
+    Bring the in-memory summary index up to date with summaries.jsonl.
+
+    Only bytes appended since the last call are read, so this is a single
+    stat() when nothing changed (e.g. another process wrote nothing new).
+
+    Returns:
+        Dict of str(episode_id) -> raw summary dict
+    """
+    global _summary_index_path, _summary_index_offset
+
+    index_file = get_summary_index_file()
+
+    with _summary_index_lock:
+        # Reset if the cache location changed (PODCASTWISE_OUTPUT_DIR set after import)
+        if index_file != _summary_index_path:
+            _build_cached_summary.cache_clear()
+            _summary_index.clear()
+            _summary_index_path = index_file
+            _summary_index_offset = 0
+
+        try:
+            size = index_file.stat().st_size
+        except FileNotFoundError:
+            return _summary_index
+
+        if size < _summary_index_offset:
+            # File was replaced or truncated - reload from scratch
+            _summary_index.clear()
+            _summary_index_offset = 0
+
+        if size > _summary_index_offset:
+            # New records may replace memoized summaries
+            _build_cached_summary.cache_clear()
+            with open(index_file, 'rb', buffering=1 << 20) as f:
+                f.seek(_summary_index_offset)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # Partially written record, pick it up next time
+                    _summary_index_offset += len(line)
+                    try:
+                        record = _loads_record(line)
+                        _summary_index[str(record.pop("id"))] = record
+                    except (ValueError, KeyError):
+                        continue
+
+        return _summary_index
+
+
+def _summary_from_cache_data(data: dict) -> PodcastSummary:
+    """Build a PodcastSummary from a cached summary dict."""
+    summary = PodcastSummary.from_dict(data)
+
+    # For older cached summaries without guests, extract from soundbites
+    if not summary.guests:
+        summary.guests = extract_guests_from_soundbites(
+            summary.soundbites or [],
+            host=""  # We don't have host info here, will include all speakers
+        )
+
+    return summary
+
+
 def cache_summary(episode_id: int, summary: PodcastSummary) -> Path:
     """
     Cache a summary to disk for later export.
 
+    Appends one record to the summary cache file.
+
     Args:
         episode_id: Episode ID
         summary: PodcastSummary object
 
     Returns:
-        Path to cached file
+        Path to the summary cache file
     """
-    cache_dir = get_summary_cache_dir()
-    cache_dir.mkdir(parents=True, exist_ok=True)
+    index_file = get_summary_index_file()
+    index_file.parent.mkdir(parents=True, exist_ok=True)
 
-    cache_file = cache_dir / f"{episode_id}.json"
+    line = _dumps_record({"id": episode_id, **summary.to_dict()})
 
-    with open(cache_file, 'w') as f:
-        json.dump(summary.to_dict(), f, indent=2)
+    with _summary_index_lock:
+        # Unbuffered, so each record goes out in a single write() call
+        with open(index_file, 'a+b', buffering=0) as f:
+            # A crash mid-write can leave a torn last record without a newline;
+            # start on a fresh line so it is skipped rather than merged with this one
+            end = f.seek(0, os.SEEK_END)
+            if end:
+                f.seek(end - 1)
+                if f.read(1) != b"\n":
+                    line = b"\n" + line
+            f.write(line)
+        _build_cached_summary.cache_clear()
 
-    return cache_file
+    return index_file
 
 
 def extract_guests_from_soundbites(soundbites: list[dict], host: str) -> list[str]:
@@ -128,43 +313,54 @@ def load_cached_summary(episode_id: int) -> Optional[PodcastSummary]:
     """
     Load a cached summary from disk.
 
+    Looks in the summary index first, then falls back to the legacy
+    per-episode {episode_id}.json file. Results are memoized until new
+    summaries are cached, so callers must not mutate the returned object.
+
     Args:
         episode_id: Episode ID
 
     Returns:
         PodcastSummary object or None if not cached
     """
-    cache_file = get_summary_cache_dir() / f"{episode_id}.json"
+    _load_index()  # Pick up records appended since the last call
+    return _build_cached_summary(str(episode_id))
 
-    if not cache_file.exists():
-        return None
 
-    with open(cache_file) as f:
-        data = json.load(f)
+@lru_cache(maxsize=4096)
+def _build_cached_summary(episode_id: str) -> Optional[PodcastSummary]:
+    """Build the PodcastSummary for a cached episode (memoized by load_cached_summary)."""
+    data = _summary_index.get(episode_id)
 
-    # For older cached summaries without guests, extract from soundbites
-    guests = data.get("guests", [])
-    if not guests:
-        guests = extract_guests_from_soundbites(
-            data.get("soundbites", []),
-            host=""  # We don't have host info here, will include all speakers
-        )
+    if data is None:
+        legacy_file = get_summary_cache_dir() / f"{episode_id}.json"
+        if not legacy_file.exists():
+            return None
+        data = _loads_record(legacy_file.read_bytes())
 
-    return PodcastSummary(
-        tldr=data.get("tldr", ""),
-        who_should_listen=data.get("who_should_listen", ""),
-        key_insights=data.get("key_insights", []),
-        frameworks=data.get("frameworks", []),
-        soundbites=data.get("soundbites", []),
-        takeaways=data.get("takeaways", []),
-        references=data.get("references", {"books": [], "people": [], "tools": [], "links": []}),
-        categories=data.get("categories", []),
-        guests=guests,
-    )
+    return _summary_from_cache_data(data)
+
+
+def get_cached_summary_ids() -> set[str]:
+    """
+    Get the IDs of all cached summaries (as strings).
+
+    One index refresh plus one directory scan for legacy {id}.json files,
+    instead of a stat() per episode.
+    """
+    ids = set(_load_index())
+    try:
+        with os.scandir(get_summary_cache_dir()) as entries:
+            ids.update(entry.name[:-5] for entry in entries if entry.name.endswith(".json"))
+    except FileNotFoundError:
+        pass
+    return ids
 
 
 def is_summary_cached(episode_id: int) -> bool:
     """Check if a summary is cached."""
+    if str(episode_id) in _load_index():
+        return True
     return (get_summary_cache_dir() / f"{episode_id}.json").exists()
 
 
@@ -209,6 +405,13 @@ CATEGORY_MAP = {
     "relationships": "Other",
 }
 
+# Lowercase category -> allowed category, built once. CATEGORY_MAP entries
+# take precedence over exact allowed-category matches (e.g. "humor").
+_CATEGORY_LOOKUP = {
+    **{allowed.lower(): allowed for allowed in ALLOWED_CATEGORIES},
+    **CATEGORY_MAP,
+}
+
 
 def map_category(categories: list[str]) -> str:
     """
@@ -223,22 +426,86 @@ def map_category(categories: list[str]) -> str:
     if not categories:
         return "Other"
 
-    # Try to map the first category
+    # Return the first category that maps (or is already allowed)
     for cat in categories:
-        cat_lower = cat.lower().strip()
-        if cat_lower in CATEGORY_MAP:
-            return CATEGORY_MAP[cat_lower]
-        # Check if it's already an allowed category
-        for allowed in ALLOWED_CATEGORIES:
-            if cat_lower == allowed.lower():
-                return allowed
+        mapped = _CATEGORY_LOOKUP.get(cat.lower().strip())
+        if mapped:
+            return mapped
 
     return "Other"
 
 
 # --- Row Formatting ---
 
-def format_row(episode: ProcessedEpisode, summary: PodcastSummary) -> list:
+def _parse_date_processed(episode: ProcessedEpisode) -> Optional[datetime]:
+    """Parse an episode's date_processed, or None if it is missing or malformed."""
+    if not episode.date_processed:
+        return None  # Common for legacy records; skip the exception path
+    try:
+        return datetime.fromisoformat(episode.date_processed)
+    except (ValueError, TypeError):
+        return None
+
+
+def _format_row_core(
+    podcast_name: str,
+    title: str,
+    date_listened: str,
+    duration: str,
+    date_created: str,
+    summary: PodcastSummary,
+    episode_id: Optional[int] = None,
+) -> list:
+    """
+    Build a Google Sheets row from episode fields and a summary.
+
+    Shared by format_row, format_row_with_episode and format_row_for_youtube.
+    The hidden Episode ID cell is only added when episode_id is given.
+
+    Returns:
+        List of cell values for the row
+    """
+    # str.join builds a list from a generator anyway, so pass list comprehensions
+    # (an empty list joins to "", no branch needed)
+
+    # Format key insights as bullet list
+    insights = "\n".join([f"• {insight}" for insight in summary.key_insights or ()])
+
+    # Format frameworks as bullet list (limit to 5)
+    frameworks = "\n".join([
+        f"• {fw.get('name', '')}: {fw.get('description', '')}"
+        for fw in (summary.frameworks or ())[:5]
+    ])
+
+    # Format soundbites as bullet list (top 3, full quotes)
+    soundbites = "\n".join([
+        f'• "{sb.get("quote", "")}" —{sb.get("speaker", "Unknown")}'
+        for sb in (summary.soundbites or ())[:3]
+    ])
+
+    row = [
+        podcast_name,
+        title,
+        date_listened,
+        duration,
+        date_created,
+        ", ".join(summary.guests or ()),  # Guests
+        summary.tldr or "",               # TL;DR
+        map_category(summary.categories), # Category (single)
+        insights,
+        frameworks,
+        soundbites,
+    ]
+    if episode_id is not None:
+        row.append(episode_id)
+    return row
+
+
+def format_row(
+    episode: ProcessedEpisode,
+    summary: PodcastSummary,
+    date_obj: Optional[datetime] = None,
+) -> list:
     """
     Format an episode and summary into a row for Google Sheets.
 
@@ -254,51 +521,30 @@ def format_row(episode: ProcessedEpisode, summary: PodcastSummary) -> list:
     9. Key Insights
     10. Frameworks
     11. Soundbites (top 3)
+    12. Episode ID (hidden)
+
+    Args:
+        episode: ProcessedEpisode record
+        summary: PodcastSummary object
+        date_obj: Optional pre-parsed date_processed (parsed here if omitted)
 
     Returns:
         List of cell values for the row
     """
     # Format date
-    try:
-        date_obj = datetime.fromisoformat(episode.date_processed)
-        date_str = date_obj.strftime("%Y-%m-%d")
-    except (ValueError, TypeError):
-        date_str = ""
-
-    # Format guests as comma-separated string
-    guests_str = ", ".join(summary.guests) if summary.guests else ""
-
-    # Map to single category
-    category = map_category(summary.categories)
-
-    # Format key insights as bullet list
-    insights = "\n".join(f"• {insight}" for insight in summary.key_insights) if summary.key_insights else ""
-
-    # Format frameworks as bullet list
-    frameworks = "\n".join(
-        f"• {fw.get('name', '')}: {fw.get('description', '')}"
-        for fw in summary.frameworks[:5]  # Limit to 5
-    ) if summary.frameworks else ""
+    if date_obj is None:
+        date_obj = _parse_date_processed(episode)
+    date_str = date_obj.strftime("%Y-%m-%d") if date_obj else ""
 
-    # Format soundbites as bullet list (top 3, full quotes)
-    soundbites = "\n".join(
-        f'• "{sb.get("quote", "")}" —{sb.get("speaker", "Unknown")}'
-        for sb in summary.soundbites[:3]
-    ) if summary.soundbites else ""
-
-    return [
+    return _format_row_core(
         episode.podcast_name,
         episode.episode_title,
         date_str,
         "",  # Duration placeholder - would need Episode object
         "",  # Date Created placeholder - would need Episode object
-        guests_str,
-        summary.tldr or "",
-        category,
-        insights,
-        frameworks,
-        soundbites,
-    ]
+        summary,
+        episode_id=episode.episode_id,
+    )
 
 
 def format_row_with_episode(episode: Episode, summary: PodcastSummary) -> list:
@@ -312,40 +558,15 @@ def format_row_with_episode(episode: Episode, summary: PodcastSummary) -> list:
     # Format date created (publication date)
     date_created_str = episode.date_published.strftime("%Y-%m-%d") if episode.date_published else ""
 
-    # Format guests as comma-separated string
-    guests_str = ", ".join(summary.guests) if summary.guests else ""
-
-    # Map to single category
-    category = map_category(summary.categories)
-
-    # Format key insights as bullet list
-    insights = "\n".join(f"• {insight}" for insight in summary.key_insights) if summary.key_insights else ""
-
-    # Format frameworks as bullet list
-    frameworks = "\n".join(
-        f"• {fw.get('name', '')}: {fw.get('description', '')}"
-        for fw in summary.frameworks[:5]  # Limit to 5
-    ) if summary.frameworks else ""
-
-    # Format soundbites as bullet list (top 3, full quotes)
-    soundbites = "\n".join(
-        f'• "{sb.get("quote", "")}" —{sb.get("speaker", "Unknown")}'
-        for sb in summary.soundbites[:3]
-    ) if summary.soundbites else ""
-
-    return [
+    return _format_row_core(
         episode.podcast_name,
         episode.title,
         date_listened_str,
         episode.duration_formatted,
         date_created_str,
-        guests_str,
-        summary.tldr or "",
-        category,
-        insights,
-        frameworks,
-        soundbites,
-    ]
+        summary,
+        episode_id=episode.id,
+    )
 
 
 # --- Sheet Header ---
@@ -362,36 +583,55 @@ SHEET_HEADERS = [
     "Key Insights",
     "Frameworks",
     "Soundbites",
+    "Episode ID",
 ]
 
+# Last column (L) holds the numeric episode ID, hidden. Unlike titles it is
+# stable across renames, so duplicate detection matches on it first.
+EPISODE_ID_HEADER = "Episode ID"
+EPISODE_ID_COLUMN = len(SHEET_HEADERS)  # 1-indexed
+
 
 # --- Year Tab and Duplicate Detection ---
 
-def get_or_create_year_tab(spreadsheet, year: int):
+def get_or_create_year_tab(spreadsheet, year: int, worksheets_by_title: Optional[dict] = None):
     """
     Get or create a worksheet tab for a specific year.
 
     Args:
         spreadsheet: gspread Spreadsheet object
         year: Year (e.g., 2025)
+        worksheets_by_title: Optional dict of tab title -> worksheet from a single
+                             spreadsheet.worksheets() call. Looked up instead of
+                             fetching the tab, and updated if the tab is created.
 
     Returns:
         Worksheet for the year
     """
+    load_env()
     tab_name = os.getenv("GOOGLE_SHEETS_TAB_NAME", "Summary")
 
     # Try to get existing tab
-    try:
-        worksheet = spreadsheet.worksheet(tab_name)
-        return worksheet
-    except Exception:
-        pass  # Tab doesn't exist, create it
+    if worksheets_by_title is not None:
+        worksheet = worksheets_by_title.get(tab_name)
+        if worksheet is not None:
+            return worksheet
+    else:
+        try:
+            worksheet = spreadsheet.worksheet(tab_name)
+            return worksheet
+        except Exception:
+            pass  # Tab doesn't exist, create it
 
-    # Create new tab (11 columns for all headers)
-    worksheet = spreadsheet.add_worksheet(tab_name, rows=1000, cols=11)
+    # Create new tab (one column per header)
+    worksheet = spreadsheet.add_worksheet(tab_name, rows=1000, cols=len(SHEET_HEADERS))
 
     # Add headers
     worksheet.insert_row(SHEET_HEADERS, 1)
+    add_episode_id_column(spreadsheet, worksheet)
+
+    if worksheets_by_title is not None:
+        worksheets_by_title[tab_name] = worksheet
 
     return worksheet
 
@@ -415,6 +655,141 @@ def get_existing_episode_ids(worksheet) -> set[str]:
         return set()
 
 
+def _batch_get_columns(spreadsheet, worksheets: Optional[list], column_ranges: tuple[str, ...]) -> dict[str, list[list[str]]]:
+    """
+    Read the same single-column ranges from every tab in one batchGet request.
+
+    Args:
+        spreadsheet: gspread Spreadsheet object
+        worksheets: Optional list of worksheets (defaults to all tabs)
+        column_ranges: A1 column ranges without the tab, e.g. ("B2:B", "L1:L")
+
+    Returns:
+        Dict of tab title -> one list of cell values per range (blank cells as "").
+        Empty if the request fails, so callers can fall back to per-tab reads.
+    """
+    try:
+        if worksheets is None:
+            worksheets = spreadsheet.worksheets()
+        if not worksheets:
+            return {}
+
+        # Quote tab names for A1 notation (embedded quotes are doubled)
+        ranges = [
+            "'{}'!{}".format(ws.title.replace("'", "''"), column_range)
+            for ws in worksheets
+            for column_range in column_ranges
+        ]
+        response = spreadsheet.values_batch_get(ranges)
+    except Exception as e:
+        console.print(f"[yellow]Batch read of sheet columns failed, reading tabs one by one: {e}[/yellow]")
+        return {}
+
+    value_ranges = response.get("valueRanges", [])
+    columns_by_tab = {}
+    for i, ws in enumerate(worksheets):
+        tab_ranges = value_ranges[i * len(column_ranges):(i + 1) * len(column_ranges)]
+        if len(tab_ranges) != len(column_ranges):
+            break
+        columns_by_tab[ws.title] = [
+            [row[0] if row else "" for row in value_range.get("values", [])]
+            for value_range in tab_ranges
+        ]
+    return columns_by_tab
+
+
+def get_title_columns_by_tab(spreadsheet, worksheets: Optional[list] = None) -> dict[str, list[str]]:
+    """
+    Get column B (Episode Title) below the header for every tab in a single batchGet request.
+
+    Args:
+        spreadsheet: gspread Spreadsheet object
+        worksheets: Optional list of worksheets (defaults to all tabs)
+
+    Returns:
+        Dict of tab title -> list of titles in row order (blank rows as "").
+        Empty if the request fails, so callers can fall back to per-tab reads.
+    """
+    return {
+        title: columns[0]
+        for title, columns in _batch_get_columns(spreadsheet, worksheets, ("B2:B",)).items()
+    }
+
+
+def add_episode_id_column(spreadsheet, worksheet) -> None:
+    """
+    Make sure a tab has room for the Episode ID column and hide it.
+
+    Safe to repeat: the grid is only widened when it is too narrow.
+
+    Args:
+        spreadsheet: gspread Spreadsheet object
+        worksheet: gspread Worksheet object
+    """
+    requests = []
+    if worksheet.col_count < EPISODE_ID_COLUMN:
+        requests.append({
+            "appendDimension": {
+                "sheetId": worksheet.id,
+                "dimension": "COLUMNS",
+                "length": EPISODE_ID_COLUMN - worksheet.col_count,
+            }
+        })
+    requests.append({
+        "updateDimensionProperties": {
+            "range": {
+                "sheetId": worksheet.id,
+                "dimension": "COLUMNS",
+                "startIndex": EPISODE_ID_COLUMN - 1,
+                "endIndex": EPISODE_ID_COLUMN,
+            },
+            "properties": {"hiddenByUser": True},
+            "fields": "hiddenByUser",
+        }
+    })
+    _sheets_write(spreadsheet.batch_update, {"requests": requests})
+
+
+def get_existing_titles_by_tab(spreadsheet, worksheets: Optional[list] = None) -> dict[str, set[str]]:
+    """
+    Get episode titles (column B) for every tab in a single batchGet request.
+
+    Args:
+        spreadsheet: gspread Spreadsheet object
+        worksheets: Optional list of worksheets (defaults to all tabs)
+
+    Returns:
+        Dict of tab title -> set of episode titles. Empty if the request fails,
+        so callers can fall back to per-tab reads.
+    """
+    return {
+        title: {t for t in column if t}
+        for title, column in get_title_columns_by_tab(spreadsheet, worksheets).items()
+    }
+
+
+def append_values(spreadsheet, tab_title: str, rows: list[list]) -> dict:
+    """
+    Append rows after the last row of a tab with one values.append request.
+
+    Uses INSERT_ROWS so the grid grows as needed.
+
+    Args:
+        spreadsheet: gspread Spreadsheet object
+        tab_title: Worksheet title
+        rows: List of row value lists
+
+    Returns:
+        The values.append API response (includes the updated range)
+    """
+    return _sheets_write(
+        spreadsheet.values_append,
+        "'{}'!A1".format(tab_title.replace("'", "''")),
+        params={"valueInputOption": "RAW", "insertDataOption": "INSERT_ROWS"},
+        body={"values": rows},
+    )
+
+
 def is_duplicate(worksheet, episode_title: str) -> bool:
     """
     Check if an episode is already in the worksheet.
@@ -438,34 +813,52 @@ def cleanup_sheet_duplicates(worksheet) -> int:
 
     Returns number of rows deleted.
     """
-    all_rows = worksheet.get_all_values()
-    if len(all_rows) <= 1:  # Only header or empty
+    # Only column B (Episode Title) is needed; blank cells come back as []
+    col_b = worksheet.get("B1:B")
+    if len(col_b) <= 1:  # Only header or empty
         return 0
 
-    # Track last occurrence of each title (by row number)
+    # Walk bottom-up so the first time a title is seen is its last occurrence;
+    # every earlier row with the same title is a duplicate to delete.
     # Row numbers are 1-indexed, row 1 is header
-    title_to_last_row = {}
-    for row_num, row in enumerate(all_rows[1:], start=2):  # Skip header
-        if len(row) > 1:
-            title = row[1]  # Column B = Episode Title
-            title_to_last_row[title] = row_num
-
-    # Find rows to delete (earlier duplicates)
     rows_to_delete = []
     seen_titles = set()
-    for row_num, row in enumerate(all_rows[1:], start=2):
-        if len(row) <= 1:
+    for row_num in range(len(col_b), 1, -1):
+        row = col_b[row_num - 1]
+        if not row:
             continue
-        title = row[1]
+        title = row[0]
         if title in seen_titles:
-            # This is a duplicate, check if it's the one to keep
-            if row_num != title_to_last_row[title]:
-                rows_to_delete.append(row_num)
-        seen_titles.add(title)
+            rows_to_delete.append(row_num)
+        else:
+            seen_titles.add(title)
 
-    # Delete rows from bottom to top (so row numbers don't shift)
-    for row_num in sorted(rows_to_delete, reverse=True):
-        worksheet.delete_rows(row_num)
+    if not rows_to_delete:
+        return 0
+
+    # Coalesce contiguous row numbers into (start, end) ranges
+    ranges = []
+    for row_num in sorted(rows_to_delete):
+        if ranges and row_num == ranges[-1][1] + 1:
+            ranges[-1][1] = row_num
+        else:
+            ranges.append([row_num, row_num])
+
+    # Delete all ranges in one batchUpdate, bottom to top (so row numbers don't shift)
+    requests = [
+        {
+            "deleteDimension": {
+                "range": {
+                    "sheetId": worksheet.id,
+                    "dimension": "ROWS",
+                    "startIndex": start - 1,  # 0-indexed, inclusive
+                    "endIndex": end,          # exclusive
+                }
+            }
+        }
+        for start, end in reversed(ranges)
+    ]
+    _sheets_write(worksheet.spreadsheet.batch_update, {"requests": requests})
 
     return len(rows_to_delete)
 
@@ -505,6 +898,116 @@ def cleanup_all_sheets() -> dict:
 
 # --- Export Functions ---
 
+# Keep each write request well under the Sheets per-request payload limits
+SHEETS_MAX_ROWS_PER_WRITE = 500
+SHEETS_MAX_CELLS_PER_WRITE = 30000
+
+
+def _iter_chunks(
+    rows: list[list],
+    max_rows: int = SHEETS_MAX_ROWS_PER_WRITE,
+    max_cells: int = SHEETS_MAX_CELLS_PER_WRITE,
+):
+    """
+    Split rows into consecutive chunks small enough for one write request.
+
+    Args:
+        rows: Row value lists
+        max_rows: Maximum rows per chunk
+        max_cells: Maximum cells per chunk (a single oversized row still gets its own chunk)
+
+    Yields:
+        (start index into rows, chunk of rows)
+    """
+    start = 0
+    chunk = []
+    cells = 0
+    for row in rows:
+        if chunk and (len(chunk) >= max_rows or cells + len(row) > max_cells):
+            yield start, chunk
+            start += len(chunk)
+            chunk = []
+            cells = 0
+        chunk.append(row)
+        cells += len(row)
+    if chunk:
+        yield start, chunk
+
+
+def _column_letter(column: int) -> str:
+    """Convert a 1-indexed column number to its A1 letter(s)."""
+    letters = ""
+    while column:
+        column, remainder = divmod(column - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def _prepare_tab(
+    spreadsheet,
+    worksheet,
+    columns: Optional[list[list[str]]],
+    created: bool,
+    ids_by_title: dict[str, int],
+    has_id_column: bool = True,
+    widened: bool = False,
+) -> dict:
+    """
+    Work out what export_to_sheets needs to know about a tab before writing.
+
+    Args:
+        spreadsheet: gspread Spreadsheet object
+        worksheet: gspread Worksheet object
+        columns: [titles from B2, Episode ID column from row 1] from the batch read,
+                 or None if the tab was not part of it
+        created: Whether the tab was created during this export
+        ids_by_title: Title -> episode ID, for backfilling the ID column
+        has_id_column: Whether the tab's grid reaches the Episode ID column
+        widened: Whether the Episode ID column was just added (and hidden)
+
+    Returns:
+        Dict with "worksheet", "next_row" (None if unknown), "rows" (to fill),
+        "titles" and "ids" already in the sheet, "backfill" (Episode ID
+        column values to write, or None) and "has_id_column"
+    """
+    backfill = None
+
+    if columns is not None:
+        title_column, id_column = columns
+        if not id_column or id_column[0] != EPISODE_ID_HEADER:
+            # Tab predates the Episode ID column: hide it and backfill by title
+            try:
+                if not widened:
+                    add_episode_id_column(spreadsheet, worksheet)
+                backfill = [EPISODE_ID_HEADER] + [ids_by_title.get(t, "") for t in title_column]
+                id_column = backfill
+            except Exception as e:
+                console.print(f"[yellow]Could not add Episode ID column: {e}[/yellow]")
+        next_row = max(len(title_column), len(id_column) - 1) + 2
+    elif created:
+        title_column, id_column = [], []  # Header row only
+        next_row = 2
+    else:
+        # The batch read failed
+        id_column = []
+        try:
+            title_column = worksheet.col_values(2)[1:]  # Skip header row
+            next_row = len(title_column) + 2
+        except Exception:
+            title_column = []
+            next_row = None  # Unknown sheet length: fall back to appending
+
+    return {
+        "worksheet": worksheet,
+        "next_row": next_row,
+        "rows": [],
+        "titles": {t for t in title_column if t},
+        "ids": {int(v) for v in id_column[1:] if str(v).isdigit()},
+        "backfill": backfill,
+        "has_id_column": has_id_column,
+    }
+
+
 def export_to_sheets(
     episodes: Optional[list[Episode]] = None,
     from_date: Optional[datetime] = None,
@@ -528,10 +1031,7 @@ def export_to_sheets(
     state = get_state_manager()
 
     # Get all successfully processed episodes
-    processed = [
-        ep for ep in state.list_processed()
-        if ep.status == "success"
-    ]
+    processed = state.list_processed(status="success")
 
     if not processed:
         console.print("[yellow]No successfully summarized episodes found.[/yellow]")
@@ -542,21 +1042,34 @@ def export_to_sheets(
     if episodes:
         episode_lookup = {ep.id: ep for ep in episodes}
 
+    # Parse each date_processed once for filtering, grouping and row formatting
+    parsed_dates = {ep.episode_id: _parse_date_processed(ep) for ep in processed}
+
     # Filter by date if specified
     if from_date or to_date:
         filtered = []
         for ep in processed:
-            try:
-                ep_date = datetime.fromisoformat(ep.date_processed)
+            ep_date = parsed_dates[ep.episode_id]
+            if ep_date is not None:  # Include if date parsing fails
                 if from_date and ep_date < from_date:
                     continue
                 if to_date and ep_date > to_date:
                     continue
-                filtered.append(ep)
-            except (ValueError, TypeError):
-                filtered.append(ep)  # Include if date parsing fails
+            filtered.append(ep)
         processed = filtered
 
+    # Episodes already exported per local state need neither a summary load
+    # nor a sheet check, so drop them before doing any work
+    exported_ids = state.get_exported_ids()
+    pending = [ep for ep in processed if ep.episode_id not in exported_ids]
+    already_exported = len(processed) - len(pending)
+    processed = pending
+
+    if already_exported:
+        console.print(f"[dim]↷ {already_exported} episodes already exported[/dim]")
+    if not processed:
+        return {"exported": 0, "skipped": 0, "duplicates": already_exported, "errors": 0}
+
     console.print(f"[cyan]Exporting {len(processed)} episodes to Google Sheets...[/cyan]")
 
     # Connect to Google Sheets
@@ -569,85 +1082,204 @@ def export_to_sheets(
         return {"exported": 0, "skipped": 0, "duplicates": 0, "errors": 1, "error": str(e)}
 
     # Group episodes by year
-    episodes_by_year: dict[int, list] = {}
+    episodes_by_year: dict[int, list] = defaultdict(list)
+    current_year = datetime.now().year
     for ep in processed:
-        try:
-            ep_date = datetime.fromisoformat(ep.date_processed)
-            year = ep_date.year
-        except (ValueError, TypeError):
-            year = datetime.now().year  # Default to current year
+        ep_date = parsed_dates[ep.episode_id]
+        year = ep_date.year if ep_date else current_year  # Default to current year
 
-        if year not in episodes_by_year:
-            episodes_by_year[year] = []
         episodes_by_year[year].append(ep)
 
     # Export each year
     exported = 0
     skipped = 0
-    duplicates = 0
+    duplicates = already_exported
     errors = 0
 
-    # Cache worksheets and their existing episodes
-    worksheet_cache: dict[int, tuple] = {}
+    # Fetch the tab list once, then existing titles for every tab in one request
+    try:
+        worksheets_by_title = {ws.title: ws for ws in spreadsheet.worksheets()}
+    except Exception as e:
+        console.print(f"[red]Failed to list worksheets: {e}[/red]")
+        return {"exported": 0, "skipped": 0, "duplicates": 0, "errors": 1, "error": str(e)}
+    listed_titles = set(worksheets_by_title)
+
+    # Only the tabs being exported to are read
+    target_tabs = {}
+    for year in episodes_by_year:
+        worksheet = get_or_create_year_tab(spreadsheet, year, worksheets_by_title)
+        target_tabs[worksheet.title] = worksheet
+
+    # Tabs from before the Episode ID column are too narrow for it, and reading
+    # past the grid fails the whole batch: widen (and hide) the column first
+    id_column_tabs = set()
+    widened_tabs = set()
+    for title, worksheet in target_tabs.items():
+        if title in listed_titles and worksheet.col_count < EPISODE_ID_COLUMN:
+            try:
+                add_episode_id_column(spreadsheet, worksheet)
+            except Exception as e:
+                console.print(f"[yellow]Could not add Episode ID column to {title}: {e}[/yellow]")
+                continue
+            widened_tabs.add(title)
+        id_column_tabs.add(title)
 
-    for year in sorted(episodes_by_year.keys(), reverse=True):
-        year_episodes = episodes_by_year[year]
-        console.print(f"\n[bold]Year {year}[/bold] ({len(year_episodes)} episodes)")
+    columns_by_tab = _batch_get_columns(
+        spreadsheet,
+        [target_tabs[title] for title in id_column_tabs if title in listed_titles],
+        ("B2:B", f"{_column_letter(EPISODE_ID_COLUMN)}1:{_column_letter(EPISODE_ID_COLUMN)}"),
+    )
 
-        # Get or create worksheet for this year
-        worksheet = get_or_create_year_tab(spreadsheet, year)
-        existing_titles = get_existing_episode_ids(worksheet)
+    # Title -> episode ID for backfilling tabs written before the ID column
+    # existed (titles shared by several episodes are ambiguous and left blank)
+    ids_by_title: dict[str, int] = {}
+    ambiguous_titles = set()
+    for ep in state.list_processed(status="success"):
+        if ep.episode_title in ids_by_title:
+            ambiguous_titles.add(ep.episode_title)
+        ids_by_title[ep.episode_title] = ep.episode_id
+    for title in ambiguous_titles:
+        del ids_by_title[title]
+
+    # Everything cached up front, so per-episode loads skip the disk checks
+    cached_ids = get_cached_summary_ids()
+
+    # Per tab: {"worksheet", "next_row", "rows", "titles", "ids", "backfill", "has_id_column"}
+    pending_by_tab: dict[str, dict] = {}
+
+    # Write state changes once at the end instead of once per episode
+    with state.batched():
+        for year in sorted(episodes_by_year.keys(), reverse=True):
+            year_episodes = episodes_by_year[year]
+            console.print(f"\n[bold]Year {year}[/bold] ({len(year_episodes)} episodes)")
+
+            # Get or create worksheet for this year
+            worksheet = get_or_create_year_tab(spreadsheet, year, worksheets_by_title)
+            if worksheet.title not in pending_by_tab:
+                pending_by_tab[worksheet.title] = _prepare_tab(
+                    spreadsheet, worksheet, columns_by_tab.get(worksheet.title),
+                    created=worksheet.title not in listed_titles,
+                    ids_by_title=ids_by_title,
+                    has_id_column=worksheet.title in id_column_tabs,
+                    widened=worksheet.title in widened_tabs,
+                )
+            existing_titles = pending_by_tab[worksheet.title]["titles"]
+            existing_ids = pending_by_tab[worksheet.title]["ids"]
+
+            # Collect rows to batch insert
+            rows_to_add = pending_by_tab[worksheet.title]["rows"]
+
+            for proc_ep in year_episodes:
+                # Already-exported episodes were filtered out above via local state;
+                # fallback check: ID or title in sheet (catches edge cases)
+                if proc_ep.episode_id in existing_ids or proc_ep.episode_title in existing_titles:
+                    console.print(f"[dim]↷ {proc_ep.episode_title[:45]}... (already in sheet)[/dim]")
+                    duplicates += 1
+                    # Repair local state
+                    state.mark_exported(proc_ep.episode_id)
+                    continue
 
-        # Collect rows to batch insert
-        rows_to_add = []
+                # Load cached summary (index already refreshed by get_cached_summary_ids)
+                cache_key = str(proc_ep.episode_id)
+                summary = _build_cached_summary(cache_key) if cache_key in cached_ids else None
 
-        for proc_ep in year_episodes:
-            # Primary check: local state (fast, reliable)
-            if state.is_exported(proc_ep.episode_id):
-                console.print(f"[dim]↷ {proc_ep.episode_title[:45]}... (already exported)[/dim]")
-                duplicates += 1
-                continue
+                if not summary:
+                    console.print(f"[yellow]⊘[/yellow] {proc_ep.episode_title[:45]}... (no cached summary)")
+                    skipped += 1
+                    continue
 
-            # Fallback check: title in sheet (catches edge cases)
-            if proc_ep.episode_title in existing_titles:
-                console.print(f"[dim]↷ {proc_ep.episode_title[:45]}... (already in sheet)[/dim]")
-                duplicates += 1
-                # Repair local state
-                state.mark_exported(proc_ep.episode_id)
+                # Use full Episode object if available for duration
+                if proc_ep.episode_id in episode_lookup:
+                    row = format_row_with_episode(episode_lookup[proc_ep.episode_id], summary)
+                else:
+                    row = format_row(proc_ep, summary, date_obj=parsed_dates[proc_ep.episode_id])
+                if not pending_by_tab[worksheet.title]["has_id_column"]:
+                    row = row[:EPISODE_ID_COLUMN - 1]
+
+                rows_to_add.append((proc_ep, row))
+                # Track for subsequent duplicates
+                existing_titles.add(proc_ep.episode_title)
+                existing_ids.add(proc_ep.episode_id)
+
+        # Write rows for every tab with as few values batchUpdate requests as
+        # the per-request size limits allow
+        ranges = []  # (value range, (proc_ep, row) pairs it covers, cell count)
+        written = []
+        for tab_title, pending in pending_by_tab.items():
+            quoted_title = tab_title.replace("'", "''")
+            if pending["backfill"]:
+                # One-shot migration: header plus IDs for rows matched by title
+                column = _column_letter(EPISODE_ID_COLUMN)
+                for offset, chunk in _iter_chunks([[value] for value in pending["backfill"]]):
+                    ranges.append((
+                        {"range": f"'{quoted_title}'!{column}{offset + 1}", "values": chunk},
+                        [],
+                        len(chunk),
+                    ))
+
+            rows_to_add = pending["rows"]
+            if not rows_to_add:
                 continue
 
-            # Load cached summary
-            summary = load_cached_summary(proc_ep.episode_id)
-
-            if not summary:
-                console.print(f"[yellow]⊘[/yellow] {proc_ep.episode_title[:45]}... (no cached summary)")
-                skipped += 1
+            worksheet = pending["worksheet"]
+            if pending["next_row"] is None:
+                for offset, chunk in _iter_chunks([row for _, row in rows_to_add]):
+                    pairs = rows_to_add[offset:offset + len(chunk)]
+                    try:
+                        append_values(spreadsheet, tab_title, chunk)
+                        written.extend(pairs)
+                    except Exception as e:
+                        console.print(f"[red]✗[/red] Batch insert failed: {e}")
+                        errors += len(pairs)
                 continue
 
-            # Use full Episode object if available for duration
-            if proc_ep.episode_id in episode_lookup:
-                row = format_row_with_episode(episode_lookup[proc_ep.episode_id], summary)
-            else:
-                row = format_row(proc_ep, summary)
-
-            rows_to_add.append((proc_ep, row))
-            existing_titles.add(proc_ep.episode_title)  # Track for subsequent duplicates
+            # Unlike values.append, a values update does not grow the grid
+            last_row = pending["next_row"] + len(rows_to_add) - 1
+            if last_row > worksheet.row_count:
+                try:
+                    _sheets_write(worksheet.add_rows, last_row - worksheet.row_count)
+                except Exception as e:
+                    console.print(f"[red]✗[/red] Batch insert failed: {e}")
+                    errors += len(rows_to_add)
+                    continue
 
-        # Batch insert all rows for this year
-        if rows_to_add:
+            for offset, chunk in _iter_chunks([row for _, row in rows_to_add]):
+                ranges.append((
+                    {"range": f"'{quoted_title}'!A{pending['next_row'] + offset}", "values": chunk},
+                    rows_to_add[offset:offset + len(chunk)],
+                    sum(len(row) for row in chunk),
+                ))
+
+        # Pack consecutive ranges into requests under the cell limit
+        requests = []
+        request_cells = 0
+        for value_range in ranges:
+            if not requests or request_cells + value_range[2] > SHEETS_MAX_CELLS_PER_WRITE:
+                requests.append([])
+                request_cells = 0
+            requests[-1].append(value_range)
+            request_cells += value_range[2]
+
+        for request in requests:
+            pairs = [pair for _, range_pairs, _ in request for pair in range_pairs]
+            if not pairs:
+                console.print("[dim]Backfilling Episode ID column...[/dim]")
             try:
-                worksheet.append_rows(
-                    [row for _, row in rows_to_add],
-                    value_input_option="RAW"
+                _sheets_write(
+                    spreadsheet.values_batch_update,
+                    {"valueInputOption": "RAW", "data": [value_range for value_range, _, _ in request]},
+                    idempotent=True,  # Fixed target ranges
                 )
-                for proc_ep, _ in rows_to_add:
-                    console.print(f"[green]✓[/green] {proc_ep.podcast_name[:25]}: {proc_ep.episode_title[:35]}...")
-                    # Mark as exported in local state
-                    state.mark_exported(proc_ep.episode_id)
-                    exported += 1
+                written.extend(pairs)
             except Exception as e:
                 console.print(f"[red]✗[/red] Batch insert failed: {e}")
-                errors += len(rows_to_add)
+                errors += len(pairs)
+
+        for proc_ep, _ in written:
+            console.print(f"[green]✓[/green] {proc_ep.podcast_name[:25]}: {proc_ep.episode_title[:35]}...")
+            # Mark as exported in local state
+            state.mark_exported(proc_ep.episode_id)
+            exported += 1
 
     return {
         "exported": exported,
@@ -678,35 +1310,41 @@ def sync_export_state() -> dict:
         console.print(f"[red]Failed to connect to Google Sheets: {e}[/red]")
         return {"error": str(e), "synced": 0}
 
-    # Get all episode titles from all worksheets
-    all_titles_in_sheet = set()
-    for worksheet in spreadsheet.worksheets():
-        try:
-            titles = worksheet.col_values(2)  # Column B = Episode Title
-            all_titles_in_sheet.update(titles[1:])  # Skip header
-        except Exception:
-            continue
+    # Get all episode titles from all worksheets in one batchGet request,
+    # reading any tab it didn't return on its own
+    try:
+        worksheets = spreadsheet.worksheets()
+        titles_by_tab = get_existing_titles_by_tab(spreadsheet, worksheets)
+        all_titles_in_sheet = set()
+        for worksheet in worksheets:
+            titles = titles_by_tab.get(worksheet.title)
+            if titles is None:
+                titles = {t for t in worksheet.col_values(2)[1:] if t}  # Skip header row
+            all_titles_in_sheet.update(titles)
+    except Exception as e:
+        console.print(f"[red]Failed to read titles from Google Sheets: {e}[/red]")
+        return {"error": str(e), "synced": 0}
 
     console.print(f"[dim]Found {len(all_titles_in_sheet)} unique titles in sheet[/dim]")
 
     # Mark episodes as exported if their title is in the sheet
     synced = 0
-    for ep in state.list_processed():
-        if ep.status != "success":
-            continue
-        if state.is_exported(ep.episode_id):
-            continue  # Already marked
-
-        # Check if title (or normalized title) is in sheet
-        if ep.episode_title in all_titles_in_sheet:
-            state.mark_exported(ep.episode_id)
-            console.print(f"[green]✓[/green] Marked as exported: {ep.episode_title[:50]}...")
-            synced += 1
-        # Also try stripped version for whitespace issues
-        elif ep.episode_title.strip() in all_titles_in_sheet:
-            state.mark_exported(ep.episode_id)
-            console.print(f"[green]✓[/green] Marked as exported (whitespace fix): {ep.episode_title[:50]}...")
-            synced += 1
+    exported_ids = state.get_exported_ids()
+    with state.batched():
+        for ep in state.list_processed(status="success"):
+            if ep.episode_id in exported_ids:
+                continue  # Already marked
+
+            # Check if title (or normalized title) is in sheet
+            if ep.episode_title in all_titles_in_sheet:
+                state.mark_exported(ep.episode_id)
+                console.print(f"[green]✓[/green] Marked as exported: {ep.episode_title[:50]}...")
+                synced += 1
+            # Also try stripped version for whitespace issues
+            elif ep.episode_title.strip() in all_titles_in_sheet:
+                state.mark_exported(ep.episode_id)
+                console.print(f"[green]✓[/green] Marked as exported (whitespace fix): {ep.episode_title[:50]}...")
+                synced += 1
 
     return {"synced": synced, "total_in_sheet": len(all_titles_in_sheet)}
 
@@ -724,17 +1362,9 @@ def cache_summary_for_youtube(video_id: str, summary: PodcastSummary) -> Path:
         summary: PodcastSummary object
 
     Returns:
-        Path to cached file
+        Path to the summary cache file
     """
-    cache_dir = get_summary_cache_dir()
-    cache_dir.mkdir(parents=True, exist_ok=True)
-
-    cache_file = cache_dir / f"yt_{video_id}.json"
-
-    with open(cache_file, 'w') as f:
-        json.dump(summary.to_dict(), f, indent=2)
-
-    return cache_file
+    return cache_summary(f"yt_{video_id}", summary)
 
 
 def format_row_for_youtube(video: 'YouTubeVideo', summary: PodcastSummary) -> list:
@@ -761,48 +1391,20 @@ def format_row_for_youtube(video: 'YouTubeVideo', summary: PodcastSummary) -> li
     Returns:
         List of cell values for the row
     """
-    from .youtube import YouTubeVideo  # Import here to avoid circular import
-
     # Format date listened (today)
     date_listened_str = datetime.now().strftime("%Y-%m-%d")
 
     # Format date created (upload date)
     date_created_str = video.upload_date.strftime("%Y-%m-%d") if video.upload_date else ""
 
-    # Format guests as comma-separated string
-    guests_str = ", ".join(summary.guests) if summary.guests else ""
-
-    # Map to single category
-    category = map_category(summary.categories)
-
-    # Format key insights as bullet list
-    insights = "\n".join(f"• {insight}" for insight in summary.key_insights) if summary.key_insights else ""
-
-    # Format frameworks as bullet list
-    frameworks = "\n".join(
-        f"• {fw.get('name', '')}: {fw.get('description', '')}"
-        for fw in summary.frameworks[:5]  # Limit to 5
-    ) if summary.frameworks else ""
-
-    # Format soundbites as bullet list (top 3, full quotes)
-    soundbites = "\n".join(
-        f'• "{sb.get("quote", "")}" —{sb.get("speaker", "Unknown")}'
-        for sb in summary.soundbites[:3]
-    ) if summary.soundbites else ""
-
-    return [
+    return _format_row_core(
         video.channel,        # Podcast Name (use channel)
         video.title,          # Episode Title
-        date_listened_str,    # Date Listened
-        video.duration_formatted,  # Duration
-        date_created_str,     # Date Created
-        guests_str,           # Guests
-        summary.tldr or "",   # TL;DR
-        category,             # Category
-        insights,             # Key Insights
-        frameworks,           # Frameworks
-        soundbites,           # Soundbites
-    ]
+        date_listened_str,
+        video.duration_formatted,
+        date_created_str,
+        summary,
+    )
 
 
 def export_youtube_to_sheets(video: 'YouTubeVideo', summary: PodcastSummary) -> dict:
@@ -838,7 +1440,7 @@ def export_youtube_to_sheets(video: 'YouTubeVideo', summary: PodcastSummary) ->
     # Format and append row
     row = format_row_for_youtube(video, summary)
     try:
-        worksheet.append_row(row, value_input_option="RAW")
+        append_values(spreadsheet, worksheet.title, [row])
         return {"exported": True}
     except Exception as e:
         return {"exported": False, "error": str(e)}
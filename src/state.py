@@ -6,10 +6,19 @@ Keeps track of which episodes have been summarized to avoid re-processing.
 
 import json
 import os
+import sys
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 def get_state_dir() -> Path:
@@ -19,11 +28,11 @@ def get_state_dir() -> Path:
 
 
 def get_state_file() -> Path:
-    """Get state file path, evaluated at runtime."""
-    return get_state_dir() / "processed.json"
+    """Get state journal path, evaluated at runtime."""
+    return get_state_dir() / "processed.jsonl"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedEpisode:
     """Record of a processed episode."""
     episode_id: int
@@ -36,28 +45,160 @@ class ProcessedEpisode:
     exported_to_sheets: bool = False
 
 
+def _encode_record(record: Union["ProcessedEpisode", dict]) -> bytes:
+    """Serialize a journal record as a JSONL line (orjson handles dataclasses natively)."""
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    if not isinstance(record, dict):
+        record = asdict(record)
+    return (json.dumps(record) + "\n").encode("utf-8")
+
+
+def _intern_fields(record: dict) -> dict:
+    """Intern the repeating string fields of a record so equal values share one object."""
+    for key in ("podcast_name", "status"):
+        value = record.get(key)
+        if isinstance(value, str):
+            record[key] = sys.intern(value)
+    return record
+
+
+def _decode_record(raw: bytes) -> dict:
+    """Parse a journal record (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class StateManager:
     """Manages state of processed episodes."""
 
     def __init__(self, state_file: Optional[Path] = None):
         self.state_file = state_file if state_file is not None else get_state_file()
         self._state: dict[int, ProcessedEpisode] = {}
+        # Guards _state and the state file when the pipeline runs episodes concurrently
+        self._lock = threading.RLock()
+        # Lines in the state journal, to decide when to compact it
+        self._journal_lines = 0
+        # status -> episode IDs, kept in step with _state by _set/_remove
+        self._by_status: dict[str, set[int]] = defaultdict(set)
+        # Journal records held back while inside batched()
+        self._batch_depth = 0
+        self._pending_records: list[Union[ProcessedEpisode, dict]] = []
         self._load()
 
     def _load(self) -> None:
-        """Load state from disk."""
-        if self.state_file.exists():
-            with open(self.state_file, 'r') as f:
-                data = json.load(f)
+        """
+        Load state from disk.
+
+        The state file is a JSONL journal: one ProcessedEpisode record per line,
+        last write wins, with {"episode_id": ..., "deleted": true} tombstones.
+        A legacy processed.json next to it is migrated on first load.
+        """
+        if not self.state_file.exists():
+            legacy_file = self.state_file.with_suffix(".json")
+            if legacy_file.exists():
+                data = _decode_record(legacy_file.read_bytes())
                 for ep_id, ep_data in data.items():
-                    self._state[int(ep_id)] = ProcessedEpisode(**ep_data)
-
-    def _save(self) -> None:
-        """Save state to disk."""
-        self.state_file.parent.mkdir(parents=True, exist_ok=True)
-        data = {str(ep_id): asdict(ep) for ep_id, ep in self._state.items()}
-        with open(self.state_file, 'w') as f:
-            json.dump(data, f, indent=2)
+                    self._set(int(ep_id), ProcessedEpisode(**_intern_fields(ep_data)))
+                self.compact()
+            return
+
+        with open(self.state_file, 'rb') as f:
+            for line in f:
+                try:
+                    record = _decode_record(line)
+                except ValueError:
+                    continue  # Torn write from a crash
+                self._journal_lines += 1
+                ep_id = int(record["episode_id"])
+                if record.get("deleted"):
+                    self._remove(ep_id)
+                else:
+                    self._set(ep_id, ProcessedEpisode(**_intern_fields(record)))
+
+    def _set(self, episode_id: int, record: ProcessedEpisode) -> None:
+        """Store a record, keeping the status index in step."""
+        previous = self._state.get(episode_id)
+        if previous is not None:
+            self._by_status[previous.status].discard(episode_id)
+        self._state[episode_id] = record
+        self._by_status[record.status].add(episode_id)
+
+    def _remove(self, episode_id: int) -> None:
+        """Drop a record, keeping the status index in step."""
+        previous = self._state.pop(episode_id, None)
+        if previous is not None:
+            self._by_status[previous.status].discard(episode_id)
+
+    def _append(self, record: Union[ProcessedEpisode, dict]) -> None:
+        """Append one record to the state journal (deferred inside batched())."""
+        with self._lock:
+            if self._batch_depth:
+                self._pending_records.append(record)
+                return
+            self._write_journal([record])
+
+    def _write_journal(self, records: list[Union[ProcessedEpisode, dict]]) -> None:
+        """Append records to the state journal, compacting it when mostly stale."""
+        with self._lock:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            data = b"".join(_encode_record(record) for record in records)
+            with open(self.state_file, 'a+b', buffering=0) as f:
+                # Start on a fresh line if a crash left a torn last record
+                end = f.seek(0, os.SEEK_END)
+                if end:
+                    f.seek(end - 1)
+                    if f.read(1) != b"\n":
+                        data = b"\n" + data
+                f.write(data)
+                os.fsync(f.fileno())
+            self._journal_lines += len(records)
+
+            if self._journal_lines > 2 * len(self._state):
+                self.compact()
+
+    @contextmanager
+    def batched(self):
+        """
+        Defer journal writes until the block exits, then write them in one go.
+
+        Usage:
+            with state.batched():
+                for ep_id in ids:
+                    state.mark_exported(ep_id)
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if not self._batch_depth and self._pending_records:
+                    pending, self._pending_records = self._pending_records, []
+                    self._write_journal(pending)
+
+    def _append_episode(self, episode_id: int) -> None:
+        """Journal the current record of an episode."""
+        self._append(self._state[episode_id])
+
+    def compact(self) -> None:
+        """Rewrite the state journal with one line per episode (atomic replace)."""
+        with self._lock:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.state_file.with_suffix(".jsonl.tmp")
+            try:
+                with open(tmp_file, 'wb') as f:
+                    f.write(b"".join(_encode_record(ep) for ep in self._state.values()))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.state_file)
+            except BaseException:
+                # Leave the existing journal intact and don't strand a partial file
+                tmp_file.unlink(missing_ok=True)
+                raise
+            self._journal_lines = len(self._state)
 
     def is_processed(self, episode_id: int) -> bool:
         """Check if an episode has been processed."""
@@ -67,6 +208,13 @@ class StateManager:
         """Get processing record for an episode."""
         return self._state.get(episode_id)
 
+    def get_output_path(self, episode_id: int) -> Optional[Path]:
+        """Get the output file of a processed episode as a Path."""
+        record = self._state.get(episode_id)
+        if record is None or not record.output_file:
+            return None
+        return Path(record.output_file)
+
     def mark_processed(
         self,
         episode_id: int,
@@ -77,16 +225,17 @@ class StateManager:
         status: str = "success",
     ) -> None:
         """Mark an episode as processed."""
-        self._state[episode_id] = ProcessedEpisode(
-            episode_id=episode_id,
-            podcast_name=podcast_name,
-            episode_title=episode_title,
-            date_processed=datetime.now().isoformat(),
-            output_file=output_file,
-            video_id=video_id,
-            status=status,
-        )
-        self._save()
+        with self._lock:
+            self._set(episode_id, ProcessedEpisode(
+                episode_id=episode_id,
+                podcast_name=sys.intern(podcast_name),
+                episode_title=episode_title,
+                date_processed=datetime.now().isoformat(),
+                output_file=output_file,
+                video_id=video_id,
+                status=sys.intern(status),
+            ))
+            self._append_episode(episode_id)
 
     def mark_no_transcript(
         self,
@@ -95,15 +244,16 @@ class StateManager:
         episode_title: str,
     ) -> None:
         """Mark an episode as having no transcript available."""
-        self._state[episode_id] = ProcessedEpisode(
-            episode_id=episode_id,
-            podcast_name=podcast_name,
-            episode_title=episode_title,
-            date_processed=datetime.now().isoformat(),
-            output_file="",
-            status="no_transcript",
-        )
-        self._save()
+        with self._lock:
+            self._set(episode_id, ProcessedEpisode(
+                episode_id=episode_id,
+                podcast_name=sys.intern(podcast_name),
+                episode_title=episode_title,
+                date_processed=datetime.now().isoformat(),
+                output_file="",
+                status="no_transcript",
+            ))
+            self._append_episode(episode_id)
 
     def mark_error(
         self,
@@ -113,38 +263,44 @@ class StateManager:
         error: str,
     ) -> None:
         """Mark an episode as having an error during processing."""
-        self._state[episode_id] = ProcessedEpisode(
-            episode_id=episode_id,
-            podcast_name=podcast_name,
-            episode_title=episode_title,
-            date_processed=datetime.now().isoformat(),
-            output_file=error,  # Store error message
-            status="error",
-        )
-        self._save()
+        with self._lock:
+            self._set(episode_id, ProcessedEpisode(
+                episode_id=episode_id,
+                podcast_name=sys.intern(podcast_name),
+                episode_title=episode_title,
+                date_processed=datetime.now().isoformat(),
+                output_file=error,  # Store error message
+                status="error",
+            ))
+            self._append_episode(episode_id)
 
     def clear(self, episode_id: int) -> None:
         """Remove an episode from processed state (for re-processing)."""
-        if episode_id in self._state:
-            del self._state[episode_id]
-            self._save()
+        with self._lock:
+            if episode_id in self._state:
+                self._remove(episode_id)
+                self._append({"episode_id": episode_id, "deleted": True})
 
     def clear_all(self) -> None:
         """Clear all processed state."""
-        self._state = {}
-        self._save()
+        with self._lock:
+            self._state = {}
+            self._by_status.clear()
+            self.compact()
 
     def mark_exported(self, episode_id: int) -> None:
         """Mark an episode as exported to Google Sheets."""
-        if episode_id in self._state:
-            self._state[episode_id].exported_to_sheets = True
-            self._save()
+        with self._lock:
+            if episode_id in self._state:
+                self._state[episode_id].exported_to_sheets = True
+                self._append_episode(episode_id)
 
     def mark_not_exported(self, episode_id: int) -> None:
         """Reset export flag so the episode will be re-exported on next export run."""
-        if episode_id in self._state:
-            self._state[episode_id].exported_to_sheets = False
-            self._save()
+        with self._lock:
+            if episode_id in self._state:
+                self._state[episode_id].exported_to_sheets = False
+                self._append_episode(episode_id)
 
     def is_exported(self, episode_id: int) -> bool:
         """Check if episode has been exported to Google Sheets."""
@@ -152,23 +308,33 @@ class StateManager:
             return self._state[episode_id].exported_to_sheets
         return False
 
+    def get_exported_ids(self) -> set[int]:
+        """Get IDs of all episodes exported to Google Sheets."""
+        return {ep_id for ep_id, ep in self._state.items() if ep.exported_to_sheets}
+
     def get_stats(self) -> dict:
         """Get processing statistics."""
-        total = len(self._state)
-        success = sum(1 for ep in self._state.values() if ep.status == "success")
-        no_transcript = sum(1 for ep in self._state.values() if ep.status == "no_transcript")
-        errors = sum(1 for ep in self._state.values() if ep.status == "error")
         return {
-            "total": total,
-            "success": success,
-            "no_transcript": no_transcript,
-            "errors": errors,
+            "total": len(self._state),
+            "success": len(self._by_status.get("success", ())),
+            "no_transcript": len(self._by_status.get("no_transcript", ())),
+            "errors": len(self._by_status.get("error", ())),
         }
 
-    def list_processed(self) -> list[ProcessedEpisode]:
-        """List all processed episodes."""
+    def list_processed(self, status: Optional[str] = None) -> list[ProcessedEpisode]:
+        """
+        List processed episodes, most recent first.
+
+        Args:
+            status: Optional status to filter by (e.g. "success")
+        """
+        with self._lock:
+            if status is None:
+                episodes = list(self._state.values())
+            else:
+                episodes = [self._state[ep_id] for ep_id in self._by_status.get(status, ())]
         return sorted(
-            self._state.values(),
+            episodes,
             key=lambda x: x.date_processed,
             reverse=True
         )
@@ -6,15 +6,38 @@ Uses browser cookies for paywall authentication.
 """
 
 import http.cookiejar
+import functools
+import json
 import re
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 from difflib import SequenceMatcher
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"  # C-backed, much faster than html.parser
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    from rapidfuzz import fuzz
+except ImportError:
+    fuzz = None
 
 from .podcast_db import Episode
 from .youtube import Transcript, get_cache_dir
@@ -24,12 +47,23 @@ def get_stratechery_cookie_file():
     """Get Stratechery cookie file path, evaluated at runtime."""
     return get_cache_dir() / "stratechery_cookies.txt"
 
+
+def get_stratechery_archive_file() -> Path:
+    """Get Stratechery archive post list cache path, evaluated at runtime."""
+    return get_cache_dir() / "stratechery_archive.json"
+
 # Default browser for cookie extraction
 DEFAULT_BROWSER = "chrome"
 
 # Stratechery daily email archive URL
 STRATECHERY_ARCHIVE_URL = "https://stratechery.com/category/daily-email/"
 
+# How long the archive post list cached on disk is reused across runs
+ARCHIVE_CACHE_TTL = 6 * 60 * 60
+
+# Concurrent archive page requests (keep in step with the session's pool_maxsize)
+ARCHIVE_FETCH_WORKERS = 4
+
 
 def is_stratechery(episode: Episode) -> bool:
     """Check if episode is from Stratechery podcast."""
@@ -111,7 +145,12 @@ def load_stratechery_session() -> Optional[requests.Session]:
     session = requests.Session()
     session.headers.update({
         'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        # Every encoding urllib3 can decode here (adds br when brotli is installed)
+        'Accept-Encoding': ACCEPT_ENCODING,
     })
+    # Keep-alive connection pool; rate limits and transient gateway errors are retried here
+    retry = Retry(total=2, backoff_factor=0.5, status_forcelist=[429, 502, 503], raise_on_status=False)
+    session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=ARCHIVE_FETCH_WORKERS, max_retries=retry))
 
     # Load Netscape format cookies
     cookie_jar = http.cookiejar.MozillaCookieJar(str(cookie_file))
@@ -124,28 +163,72 @@ def load_stratechery_session() -> Optional[requests.Session]:
     return session
 
 
+# Shared session so archive pages and articles reuse pooled connections across a batch.
+# Rebuilt when the cookie file changes (e.g. after refreshing cookies).
+_session: Optional[requests.Session] = None
+_session_mtime: Optional[float] = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> Optional[requests.Session]:
+    """
+    Get the shared Stratechery session, loading it on first use.
+
+    Returns:
+        requests.Session with cookies loaded, or None if no cookies available
+    """
+    global _session, _session_mtime
+
+    try:
+        mtime = get_stratechery_cookie_file().stat().st_mtime
+    except OSError:
+        return None
+
+    with _session_lock:
+        if _session is None or _session_mtime != mtime:
+            _session = load_stratechery_session()
+            _session_mtime = mtime
+        return _session
+
+
+# Title normalization patterns, compiled once
+_RE_EP_NUM = re.compile(r'^#?\d+\s*[-–:]\s*')
+_RE_EP_PREFIX = re.compile(r'^ep\.?\s*\d+\s*[-–:]\s*')
+_RE_PIPE_SUFFIX = re.compile(r'\s*\|.*$')
+_RE_STOPWORDS = re.compile(r'\b(episode|podcast|update|interview|special)\b')
+_RE_PUNCT = re.compile(r'[^\w\s]')
+_RE_WS = re.compile(r'\s+')
+_RE_WORD = re.compile(r'\b[a-zA-Z]\w*\b')
+
+
+@functools.lru_cache(maxsize=4096)
 def normalize_title(title: str) -> str:
-    """Normalize a title for comparison."""
+    """Normalize a title for comparison (memoized; archive titles repeat across episodes)."""
     # Remove common prefixes/suffixes
     title = title.lower().strip()
     # Remove episode numbers like "#123 - " or "Ep. 45:"
-    title = re.sub(r'^#?\d+\s*[-–:]\s*', '', title)
-    title = re.sub(r'^ep\.?\s*\d+\s*[-–:]\s*', '', title)
+    title = _RE_EP_NUM.sub('', title)
+    title = _RE_EP_PREFIX.sub('', title)
     # Remove "| Podcast Name" suffixes
-    title = re.sub(r'\s*\|.*$', '', title)
+    title = _RE_PIPE_SUFFIX.sub('', title)
     # Remove common words that differ between podcast and blog
-    title = re.sub(r'\b(episode|podcast|update|interview|special)\b', '', title)
+    title = _RE_STOPWORDS.sub('', title)
     # Remove punctuation and extra whitespace
-    title = re.sub(r'[^\w\s]', ' ', title)
-    title = re.sub(r'\s+', ' ', title).strip()
+    title = _RE_PUNCT.sub(' ', title)
+    title = _RE_WS.sub(' ', title).strip()
     return title
 
 
+def _similarity_ratio(norm1: str, norm2: str) -> float:
+    """Similarity of two normalized titles (0.0 to 1.0), using rapidfuzz when available."""
+    if fuzz is not None:
+        return fuzz.ratio(norm1, norm2) / 100.0
+    return SequenceMatcher(None, norm1, norm2).ratio()
+
+
 def title_similarity(title1: str, title2: str) -> float:
     """Calculate similarity between two titles (0.0 to 1.0)."""
-    norm1 = normalize_title(title1)
-    norm2 = normalize_title(title2)
-    return SequenceMatcher(None, norm1, norm2).ratio()
+    return _similarity_ratio(normalize_title(title1), normalize_title(title2))
 
 
 # Words that are structural/template, not content-distinguishing
@@ -161,7 +244,8 @@ _TEMPLATE_WORDS = frozenset({
 })
 
 
-def extract_content_words(title: str) -> set[str]:
+@functools.lru_cache(maxsize=4096)
+def extract_content_words(title: str) -> frozenset[str]:
     """
     Extract content (non-template) words from a title.
 
@@ -169,9 +253,18 @@ def extract_content_words(title: str) -> set[str]:
     that differ between similar-looking titles like
     "An Interview with Anduril CEO Brian Schimpf" vs
     "An Interview with Cursor CEO Michael Truell".
+
+    Memoized, so the result is a frozenset.
     """
-    words = re.findall(r'\b[a-zA-Z]\w*\b', title.lower())
-    return {w for w in words if w not in _TEMPLATE_WORDS and len(w) > 2}
+    words = _RE_WORD.findall(title.lower())
+    return frozenset(w for w in words if w not in _TEMPLATE_WORDS and len(w) > 2)
+
+
+def _overlap(words1: frozenset, words2: frozenset) -> float:
+    """Fraction of words1 found in words2; 1.0 if words1 is empty."""
+    if not words1:
+        return 1.0
+    return len(words1 & words2) / len(words1)
 
 
 def content_word_overlap(title1: str, title2: str) -> float:
@@ -180,12 +273,7 @@ def content_word_overlap(title1: str, title2: str) -> float:
 
     Returns 1.0 if title1 has no content words (no penalty for generic titles).
     """
-    words1 = extract_content_words(title1)
-    if not words1:
-        return 1.0
-    words2 = extract_content_words(title2)
-    overlap = words1 & words2
-    return len(overlap) / len(words1)
+    return _overlap(extract_content_words(title1), extract_content_words(title2))
 
 
 def search_stratechery_posts(session: requests.Session, max_pages: int = 3) -> list[dict]:
@@ -201,30 +289,39 @@ def search_stratechery_posts(session: requests.Session, max_pages: int = 3) -> l
     """
     posts = []
 
-    for page in range(1, max_pages + 1):
-        if page == 1:
-            url = STRATECHERY_ARCHIVE_URL
-        else:
-            url = f"{STRATECHERY_ARCHIVE_URL}page/{page}/"
+    urls = [STRATECHERY_ARCHIVE_URL] + [
+        f"{STRATECHERY_ARCHIVE_URL}page/{page}/" for page in range(2, max_pages + 1)
+    ]
 
+    def fetch(url: str) -> Optional[requests.Response]:
         try:
             response = session.get(url, timeout=30)
-            # Handle rate limiting
-            if response.status_code == 429:
-                time.sleep(2)  # Wait and retry once
-                response = session.get(url, timeout=30)
             response.raise_for_status()
+            return response
         except requests.RequestException:
-            break
+            return None
+
+    # Pages are IO-bound and independent: fetch them concurrently (matching the
+    # session's connection pool size), then parse in page order
+    with ThreadPoolExecutor(max_workers=ARCHIVE_FETCH_WORKERS) as executor:
+        responses = list(executor.map(fetch, urls))
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+    for response in responses:
+        if response is None:
+            break
 
-        # Find article links - h2 a captures the main blog post titles
-        articles = soup.select('h2 a')
+        # Find article links - h2 a captures the main blog post titles.
+        # Only title/href pairs are needed, so prefer the lighter selectolax parser.
+        if LexborHTMLParser is not None:
+            articles = [
+                (a.text(strip=True), a.attributes.get('href'))
+                for a in LexborHTMLParser(response.content).css('h2 a')
+            ]
+        else:
+            soup = BeautifulSoup(response.content, HTML_PARSER)
+            articles = [(a.get_text(strip=True), a.get('href')) for a in soup.select('h2 a')]
 
-        for article in articles:
-            title = article.get_text(strip=True)
-            href = article.get('href')
+        for title, href in articles:
             # Only include links to stratechery.com (filter out other podcast sites)
             if title and href and 'stratechery.com' in href:
                 posts.append({
@@ -239,30 +336,39 @@ def search_stratechery_posts(session: requests.Session, max_pages: int = 3) -> l
     return posts
 
 
+# Combined match score at which find_matching_post stops scanning the archive
+STRONG_MATCH_SCORE = 0.9
+
+
 def find_matching_post(
     episode: Episode,
     posts: list[dict],
     min_similarity: float = 0.4,
     min_content_overlap: float = 0.3,
+    min_score: float = 0.0,
 ) -> Optional[dict]:
     """
     Find the best matching blog post for an episode.
 
-    Uses two criteria:
-    1. Overall title similarity (SequenceMatcher ratio) >= min_similarity
-    2. Content word overlap (guest names, company names, topics) >= min_content_overlap
+    Uses two criteria (the cheap overlap check runs first):
+    1. Content word overlap (guest names, company names, topics) >= min_content_overlap
+    2. Overall title similarity ratio >= min_similarity
 
     The content-word gate prevents false matches between structurally similar titles
     like "An Interview with Anduril CEO Brian Schimpf" vs
     "An Interview with Cursor CEO Michael Truell" — they score ~0.7 on similarity
     alone but near 0.0 on content-word overlap.
 
+    The archive is newest first, so the scan stops at the first post scoring
+    STRONG_MATCH_SCORE or more.
+
     Args:
         episode: Episode to match
         posts: List of posts with 'title' and 'url'
-        min_similarity: Minimum SequenceMatcher ratio to consider a match
+        min_similarity: Minimum similarity ratio to consider a match
         min_content_overlap: Minimum fraction of episode content words that must
                              appear in the article title (0.0 disables the gate)
+        min_score: Minimum combined score for the best match to be returned
 
     Returns:
         Best matching post dict, or None if no good match found
@@ -273,26 +379,38 @@ def find_matching_post(
     best_match = None
     best_score = 0.0
 
-    for post in posts:
-        sim = title_similarity(episode.title, post['title'])
+    # Episode-side work is done once; post titles hit the memoized helpers
+    ep_norm = normalize_title(episode.title)
+    ep_words = extract_content_words(episode.title)
 
-        # Gate 1: minimum overall similarity
-        if sim < min_similarity:
+    for post in posts:
+        # Gate 1: content-word overlap — prevents template-driven false matches.
+        # Checked first since a set intersection is far cheaper than the similarity ratio
+        overlap = _overlap(ep_words, extract_content_words(post['title']))
+        if overlap < min_content_overlap:
             continue
 
-        # Gate 2: content-word overlap — prevents template-driven false matches
-        overlap = content_word_overlap(episode.title, post['title'])
-        if overlap < min_content_overlap:
+        # Gate 2: minimum overall similarity
+        post_norm = normalize_title(post['title'])
+        if post_norm == ep_norm:
+            sim = 1.0
+        else:
+            sim = _similarity_ratio(ep_norm, post_norm)
+        if sim < min_similarity:
             continue
 
         # Combined score: weight similarity more than overlap
         score = sim * 0.7 + overlap * 0.3
 
+        # Near-certain match: nothing later in the archive will meaningfully beat it
+        if score >= STRONG_MATCH_SCORE:
+            return post
+
         if score > best_score:
             best_score = score
             best_match = post
 
-    return best_match
+    return best_match if best_score >= min_score else None
 
 
 def extract_article_text(session: requests.Session, url: str) -> Optional[str]:
@@ -308,15 +426,11 @@ def extract_article_text(session: requests.Session, url: str) -> Optional[str]:
     """
     try:
         response = session.get(url, timeout=30)
-        # Handle rate limiting with retry
-        if response.status_code == 429:
-            time.sleep(2)
-            response = session.get(url, timeout=30)
         response.raise_for_status()
     except requests.RequestException:
         return None
 
-    soup = BeautifulSoup(response.text, 'html.parser')
+    soup = BeautifulSoup(response.content, HTML_PARSER)
 
     # Find the main article content - adjust selectors based on actual site structure
     content = None
@@ -358,8 +472,85 @@ def extract_article_text(session: requests.Session, url: str) -> Optional[str]:
 
 
 # Module-level cache: avoid fetching 20 archive pages per episode in a batch run.
-# Valid for the lifetime of the process (archive doesn't change mid-run).
+# Valid for the lifetime of the process (archive doesn't change mid-run), and
+# backed by a disk cache reused across runs for ARCHIVE_CACHE_TTL.
 _cached_posts: Optional[list[dict]] = None
+_cached_posts_from_disk = False
+_cached_posts_lock = threading.Lock()
+# First archive page only, tried before the full list is fetched
+_recent_posts: Optional[list[dict]] = None
+
+
+def _load_archive_cache() -> Optional[list[dict]]:
+    """Load the archive post list cached on disk, or None if missing or stale."""
+    try:
+        with open(get_stratechery_archive_file(), encoding='utf-8') as f:
+            data = json.load(f)
+        if time.time() - data["fetched_at"] < ARCHIVE_CACHE_TTL:
+            return data["posts"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _save_archive_cache(posts: list[dict]) -> None:
+    """Cache the archive post list on disk for later runs."""
+    archive_file = get_stratechery_archive_file()
+    try:
+        archive_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = archive_file.with_suffix(".json.tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({"fetched_at": time.time(), "posts": posts}, f, ensure_ascii=False, separators=(',', ':'))
+        tmp_file.replace(archive_file)
+    except OSError:
+        pass  # Only a cache
+
+
+def _get_archive_posts(
+    session: requests.Session,
+    refresh: bool = False,
+    fetch: bool = True,
+) -> Optional[list[dict]]:
+    """
+    Get the archive post list, from memory, the disk cache, or the site.
+
+    Args:
+        session: Authenticated requests session
+        refresh: Re-fetch if the current list came from the disk cache
+        fetch: Fetch from the site if not cached (otherwise return None)
+
+    Returns:
+        List of dicts with 'title' and 'url' keys
+    """
+    global _cached_posts, _cached_posts_from_disk
+
+    with _cached_posts_lock:
+        if _cached_posts is None and not refresh:
+            _cached_posts = _load_archive_cache()
+            _cached_posts_from_disk = _cached_posts is not None
+
+        if _cached_posts is None and not fetch:
+            return None
+
+        if _cached_posts is None or (refresh and _cached_posts_from_disk):
+            # Search for matching posts (use more pages to find older episodes)
+            # 20 pages covers ~440 posts, reaching back to early 2025
+            _cached_posts = search_stratechery_posts(session, max_pages=20)
+            _cached_posts_from_disk = False
+            if _cached_posts:
+                _save_archive_cache(_cached_posts)
+
+        return _cached_posts
+
+
+def _get_recent_posts(session: requests.Session) -> list[dict]:
+    """Get the posts on the first archive page (fetched once per process)."""
+    global _recent_posts
+
+    with _cached_posts_lock:
+        if _recent_posts is None:
+            _recent_posts = search_stratechery_posts(session, max_pages=1)
+        return _recent_posts
 
 
 def fetch_stratechery_transcript(episode: Episode) -> Optional[Transcript]:
@@ -372,27 +563,28 @@ def fetch_stratechery_transcript(episode: Episode) -> Optional[Transcript]:
     Returns:
         Transcript object or None if not found/failed
     """
-    global _cached_posts
-
-    session = load_stratechery_session()
+    session = _get_session()
     if not session:
         return None
 
-    # Reuse the cached archive list within a single process run to avoid
-    # re-fetching 20 pages for every episode in a batch.
-    if _cached_posts is None:
-        # Search for matching posts (use more pages to find older episodes)
-        # 20 pages covers ~440 posts, reaching back to early 2025
-        _cached_posts = search_stratechery_posts(session, max_pages=20)
+    match = None
+    if _get_archive_posts(session, fetch=False) is None:
+        # Nothing cached yet: recent episodes are usually on the first archive
+        # page, so settle for a strong match there before fetching all 20 pages
+        match = find_matching_post(episode, _get_recent_posts(session), min_score=STRONG_MATCH_SCORE)
 
-    posts = _cached_posts
-    if not posts:
-        return None
+    if not match:
+        # Reuse the cached archive list to avoid re-fetching 20 pages for every
+        # episode in a batch (and on every run within the cache TTL).
+        posts = _get_archive_posts(session)
+        match = find_matching_post(episode, posts) if posts else None
 
-    # Find best matching post
-    match = find_matching_post(episode, posts)
     if not match:
-        return None
+        # The disk cache may predate this episode's post: re-fetch once
+        posts = _get_archive_posts(session, refresh=True)
+        match = find_matching_post(episode, posts) if posts else None
+        if not match:
+            return None
 
     # Small delay to avoid rate limiting
     time.sleep(0.5)
@@ -5,11 +5,17 @@ Extracts structured insights from podcast transcripts.
 Supports multiple providers: Anthropic (direct) and OpenRouter.
 """
 
+import functools
+import hashlib
 import json
 import os
+import random
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional, Literal
+from typing import Optional, Literal, Union
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -17,9 +23,17 @@ from dotenv import load_dotenv
 from .podcast_db import Episode
 from .youtube import Transcript
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@functools.lru_cache(maxsize=1)
+def load_env() -> None:
+    """Load environment variables from .env once, on first use rather than at import."""
+    load_dotenv()
 
-# Load environment variables
-load_dotenv()
 
 # --- Provider and Model Configuration ---
 
@@ -43,8 +57,12 @@ MODEL_CONFIG = {
     "deepseek": (PROVIDER_OPENROUTER, "deepseek/deepseek-chat"),
 }
 
-# Default model
-DEFAULT_MODEL = os.getenv("DEFAULT_MODEL", "sonnet")
+
+def get_default_model() -> str:
+    """Get the default model alias (DEFAULT_MODEL in .env, else 'sonnet')."""
+    load_env()
+    return os.getenv("DEFAULT_MODEL", "sonnet")
+
 
 def get_available_models() -> list[str]:
     """Return list of available model aliases."""
@@ -75,13 +93,15 @@ RATE_LIMIT_ENABLED = True  # Default: rate limiting on
 TOKENS_PER_MINUTE = 30000  # Anthropic's default limit
 CHARS_PER_TOKEN = 4  # Approximate
 SAFETY_MARGIN = 0.8  # Use 80% of limit to be safe
-MIN_DELAY_SECONDS = 0.5  # Minimum delay between requests
-MAX_DELAY_SECONDS = 5  # Maximum delay if transcript is very long
+LLM_MAX_ATTEMPTS = 5  # Attempts per LLM call when the provider throttles or errors
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 529}  # 529 = Anthropic overloaded
 
-# Track last request time for rate limiting
-_last_request_time = 0
-_tokens_used_this_minute = 0
-_minute_start_time = 0
+# Token bucket for rate limiting: holds up to a minute's safe budget and
+# refills continuously at TOKENS_PER_MINUTE * SAFETY_MARGIN per minute
+_bucket_tokens = TOKENS_PER_MINUTE * SAFETY_MARGIN
+_bucket_last_refill = time.monotonic()
+# Serializes rate-limit bookkeeping across concurrently processed episodes
+_rate_limit_lock = threading.Lock()
 
 # Default categories (LLM can extend)
 DEFAULT_CATEGORIES = [
@@ -101,20 +121,24 @@ MAX_TRANSCRIPT_TOKENS = 150000  # ~600K chars, Claude can handle 200K tokens
 
 # --- Client Creation ---
 
+@functools.lru_cache(maxsize=1)
 def _create_anthropic_client():
-    """Create Anthropic client."""
+    """Create Anthropic client (once; reused so connections are pooled across calls)."""
     import anthropic
+    load_env()
     api_key = os.getenv("ANTHROPIC_API_KEY")
     if not api_key:
         raise ValueError(
             "ANTHROPIC_API_KEY not set.\n"
             "Add to .env: ANTHROPIC_API_KEY=sk-ant-..."
         )
-    return anthropic.Anthropic(api_key=api_key)
+    # Retries are handled by _call_llm so throttling also drains the token bucket
+    return anthropic.Anthropic(api_key=api_key, max_retries=0)
 
 
+@functools.lru_cache(maxsize=1)
 def _create_openrouter_client():
-    """Create OpenRouter client (OpenAI-compatible)."""
+    """Create OpenRouter client (OpenAI-compatible; once, like the Anthropic client)."""
     try:
         from openai import OpenAI
     except ImportError:
@@ -122,6 +146,7 @@ def _create_openrouter_client():
             "OpenAI SDK not installed. Run:\n"
             "pip install openai"
         )
+    load_env()
     api_key = os.getenv("OPENROUTER_API_KEY")
     if not api_key:
         raise ValueError(
@@ -131,16 +156,62 @@ def _create_openrouter_client():
     return OpenAI(
         base_url="https://openrouter.ai/api/v1",
         api_key=api_key,
+        max_retries=0,
     )
 
 
-def _call_llm(prompt: str, model_alias: str) -> str:
+def _is_retryable(error: Exception) -> bool:
+    """Whether an LLM SDK error is throttling or a transient server/network failure."""
+    status = getattr(error, "status_code", None)
+    if status is not None:
+        return status in RETRYABLE_STATUS_CODES
+    # Connection errors and timeouts from either SDK carry no status code
+    return type(error).__name__ in ("APIConnectionError", "APITimeoutError")
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """Seconds to wait before retrying: Retry-After if given, else exponential, plus jitter."""
+    delay = 2 ** attempt
+    response = getattr(error, "response", None)
+    if response is not None:
+        try:
+            delay = float(response.headers.get("retry-after", delay))
+        except (TypeError, ValueError):
+            pass  # HTTP-date form; keep the exponential delay
+    return delay + random.uniform(0, 0.5)
+
+
+def _call_llm(prompt: str, model_alias: str, json_mode: bool = False) -> str:
+    """
+    Call the LLM, retrying with backoff when the provider throttles or fails transiently.
+
+    Args:
+        prompt: The prompt to send
+        model_alias: Model alias from MODEL_CONFIG
+        json_mode: Ask the provider to answer with a bare JSON object
+
+    Returns:
+        Response text from the model
     """
-    Call the LLM with the given prompt using the specified model.
+    for attempt in range(LLM_MAX_ATTEMPTS):
+        try:
+            return _send_llm_request(prompt, model_alias, json_mode)
+        except Exception as e:
+            if attempt == LLM_MAX_ATTEMPTS - 1 or not _is_retryable(e):
+                raise
+            if getattr(e, "status_code", None) == 429:
+                _drain_rate_limit_bucket()
+            time.sleep(_retry_delay(e, attempt))
+
+
+def _send_llm_request(prompt: str, model_alias: str, json_mode: bool = False) -> str:
+    """
+    Send one request to the LLM with the given prompt using the specified model.
 
     Args:
         prompt: The prompt to send
         model_alias: Model alias from MODEL_CONFIG
+        json_mode: Ask the provider to answer with a bare JSON object
 
     Returns:
         Response text from the model
@@ -149,19 +220,26 @@ def _call_llm(prompt: str, model_alias: str) -> str:
 
     if provider == PROVIDER_ANTHROPIC:
         client = _create_anthropic_client()
+        messages = [{"role": "user", "content": prompt}]
+        if json_mode:
+            # Prefill the opening brace so the reply is raw JSON, not a fenced block
+            messages.append({"role": "assistant", "content": "{"})
         message = client.messages.create(
             model=model_id,
             max_tokens=4096,
-            messages=[{"role": "user", "content": prompt}],
+            messages=messages,
         )
-        return message.content[0].text
+        text = message.content[0].text
+        return "{" + text if json_mode else text
 
     elif provider == PROVIDER_OPENROUTER:
         client = _create_openrouter_client()
+        extra = {"response_format": {"type": "json_object"}} if json_mode else {}
         response = client.chat.completions.create(
             model=model_id,
             max_tokens=4096,
             messages=[{"role": "user", "content": prompt}],
+            **extra,
         )
         return response.choices[0].message.content
 
@@ -169,6 +247,49 @@ def _call_llm(prompt: str, model_alias: str) -> str:
         raise ValueError(f"Unknown provider: {provider}")
 
 
+def _json_loads(data: Union[str, bytes]):
+    """Parse JSON text (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _parse_summary_response(response_text: str) -> 'PodcastSummary':
+    """
+    Parse an LLM JSON response into a PodcastSummary.
+
+    Responses are requested in JSON mode; the code-fence stripping remains for
+    OpenRouter models that ignore response_format.
+    """
+    if response_text.startswith("```"):
+        response_text = response_text.split("```")[1]
+        if response_text.startswith("json"):
+            response_text = response_text[4:]
+    return PodcastSummary.from_dict(_json_loads(response_text.strip()))
+
+
+def _call_llm_for_chunks(prompts: list[str], model: str) -> list[str]:
+    """
+    Call the LLM for each chunk prompt concurrently, paced by the rate limiter.
+
+    Args:
+        prompts: One prompt per transcript chunk
+        model: Model alias from MODEL_CONFIG
+
+    Returns:
+        Response texts, in prompt order
+    """
+    def call(prompt: str) -> str:
+        _apply_rate_limit(_estimate_tokens(prompt))
+        return _call_llm(prompt, model, json_mode=True)
+
+    # Parallel chunk requests per transcript
+    load_env()
+    concurrency = int(os.getenv("LLM_CONCURRENCY", "4"))
+    with ThreadPoolExecutor(max_workers=max(1, min(len(prompts), concurrency))) as executor:
+        return list(executor.map(call, prompts))
+
+
 def set_rate_limiting(enabled: bool) -> None:
     """Enable or disable rate limiting."""
     global RATE_LIMIT_ENABLED
@@ -180,53 +301,67 @@ def _estimate_tokens(text: str) -> int:
     return len(text) // CHARS_PER_TOKEN
 
 
+def _refill_bucket() -> None:
+    """Add the tokens earned since the last refill (caller holds _rate_limit_lock)."""
+    global _bucket_tokens, _bucket_last_refill
+
+    capacity = TOKENS_PER_MINUTE * SAFETY_MARGIN
+    now = time.monotonic()
+    _bucket_tokens = min(capacity, _bucket_tokens + (now - _bucket_last_refill) * capacity / 60)
+    _bucket_last_refill = now
+
+
+def _drain_rate_limit_bucket() -> None:
+    """Empty the token bucket after a 429 so concurrent calls wait for it to refill."""
+    global _bucket_tokens
+
+    with _rate_limit_lock:
+        _refill_bucket()
+        _bucket_tokens = 0.0
+
+
 def _apply_rate_limit(estimated_tokens: int) -> None:
     """
     Apply rate limiting delay if needed.
 
-    Tracks token usage and adds delays to stay under API limits.
+    Uses a token bucket that refills continuously, so requests wait only for
+    the tokens they are short of instead of for a fixed minute to roll over.
+    A request larger than the whole bucket waits for a full bucket and
+    empties it.
     """
-    global _last_request_time, _tokens_used_this_minute, _minute_start_time
+    global _bucket_tokens
 
     if not RATE_LIMIT_ENABLED:
         return
 
-    current_time = time.time()
-
-    # Reset counter if a minute has passed
-    if current_time - _minute_start_time >= 60:
-        _tokens_used_this_minute = 0
-        _minute_start_time = current_time
-
-    # Calculate safe token limit
-    safe_limit = int(TOKENS_PER_MINUTE * SAFETY_MARGIN)
-
-    # If this request would exceed the limit, wait for the minute to reset
-    if _tokens_used_this_minute + estimated_tokens > safe_limit:
-        wait_time = 60 - (current_time - _minute_start_time) + 1
-        if wait_time > 0:
-            time.sleep(wait_time)
-            _tokens_used_this_minute = 0
-            _minute_start_time = time.time()
-
-    # Calculate delay based on transcript size
-    # Longer transcripts = longer delay to spread out requests
-    delay = min(
-        MAX_DELAY_SECONDS,
-        max(MIN_DELAY_SECONDS, estimated_tokens / 20000)  # ~1 sec per 20K tokens
-    )
+    with _rate_limit_lock:
+        capacity = TOKENS_PER_MINUTE * SAFETY_MARGIN
+        needed = min(estimated_tokens, capacity)
+
+        _refill_bucket()
+        if _bucket_tokens < needed:
+            time.sleep((needed - _bucket_tokens) * 60 / capacity)
+            _refill_bucket()
 
-    # Ensure minimum time between requests
-    time_since_last = current_time - _last_request_time
-    if time_since_last < delay:
-        time.sleep(delay - time_since_last)
+        _bucket_tokens = max(0.0, _bucket_tokens - estimated_tokens)
 
-    # Update tracking
-    _tokens_used_this_minute += estimated_tokens
-    _last_request_time = time.time()
 
+# (field, default factory) in PodcastSummary field order, used to fill
+# keys missing from cached or LLM-provided summary dicts
+_SUMMARY_FIELD_DEFAULTS = (
+    ("tldr", str),
+    ("who_should_listen", str),
+    ("key_insights", list),
+    ("frameworks", list),
+    ("soundbites", list),
+    ("takeaways", list),
+    ("references", lambda: {"books": [], "people": [], "tools": [], "links": []}),
+    ("categories", list),
+    ("guests", list),
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class PodcastSummary:
     """Structured summary of a podcast episode."""
     tldr: str
@@ -252,6 +387,76 @@ class PodcastSummary:
             "guests": self.guests,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize to compact JSON (orjson handles dataclasses natively)."""
+        if orjson is not None:
+            return orjson.dumps(self)
+        return json.dumps(self.to_dict(), separators=(",", ":")).encode("utf-8")
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'PodcastSummary':
+        # Positional construction; defaults are only built for missing keys
+        return cls(*[
+            data[name] if name in data else default()
+            for name, default in _SUMMARY_FIELD_DEFAULTS
+        ])
+
+
+# --- Content-Hash Summary Cache ---
+
+def get_llm_cache_dir() -> Path:
+    """Get LLM summary cache directory, evaluated at runtime."""
+    load_env()
+    base = Path(os.getenv("PODCASTWISE_OUTPUT_DIR", "~/Documents/PodcastNotes")).expanduser()
+    return base / ".cache/llm"
+
+
+def _summary_cache_key(
+    text: str,
+    model_id: str,
+    podcast_name: str,
+    episode_title: str,
+    host: str,
+    duration: str,
+) -> str:
+    """
+    Hash of everything that goes into a summary's prompts.
+
+    Args:
+        text: Full transcript text
+        model_id: Model that produces the summary
+        podcast_name: Podcast (or channel) name in the prompt
+        episode_title: Episode title in the prompt
+        host: Host in the prompt
+        duration: Formatted duration in the prompt
+
+    Returns:
+        Hex digest; changes whenever the prompts, metadata, model or text do
+    """
+    parts = [
+        model_id, EXTRACTION_PROMPT, SYNTHESIS_PROMPT,
+        podcast_name, episode_title, host, duration, text,
+    ]
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def _load_hashed_summary(cache_key: str) -> Optional[PodcastSummary]:
+    """Load a summary previously generated from identical prompt inputs."""
+    cache_file = get_llm_cache_dir() / f"{cache_key}.json"
+    if not cache_file.exists():
+        return None
+    try:
+        return PodcastSummary.from_dict(_json_loads(cache_file.read_bytes()))
+    except (OSError, ValueError):
+        return None
+
+
+def _save_hashed_summary(cache_key: str, summary: PodcastSummary) -> None:
+    """Persist a summary under its content hash."""
+    cache_dir = get_llm_cache_dir()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    (cache_dir / f"{cache_key}.json").write_bytes(summary.to_json_bytes())
+
 
 EXTRACTION_PROMPT = """You are an expert podcast analyst. Your task is to extract structured insights from a podcast transcript.
 
@@ -319,6 +524,19 @@ Important guidelines:
 Return ONLY the JSON object, no additional text."""
 
 
+# Sentence boundary: the space after ., ? or !
+_SENTENCE_SPLIT = re.compile(r'(?<=[.!?]) ')
+
+
+def _iter_sentences(text: str):
+    """Yield the sentences of text one at a time (same pieces as _SENTENCE_SPLIT.split)."""
+    start = 0
+    for match in _SENTENCE_SPLIT.finditer(text):
+        yield text[start:match.start()]
+        start = match.end()
+    yield text[start:]
+
+
 def chunk_transcript(text: str, max_chars: int = 500000) -> list[str]:
     """
     Split transcript into chunks if too long.
@@ -329,21 +547,25 @@ def chunk_transcript(text: str, max_chars: int = 500000) -> list[str]:
         return [text]
 
     chunks = []
-    current_chunk = ""
-
-    # Split by sentences (roughly)
-    sentences = text.replace('. ', '.|').replace('? ', '?|').replace('! ', '!|').split('|')
-
-    for sentence in sentences:
-        if len(current_chunk) + len(sentence) > max_chars:
-            if current_chunk:
-                chunks.append(current_chunk.strip())
-            current_chunk = sentence
+    # Sentences in the current chunk, joined once when the chunk is full;
+    # current_len counts the separating spaces as well
+    current_chunk: list[str] = []
+    current_len = 0
+
+    # Split by sentences (roughly), lazily so only the current chunk's
+    # sentences are held alongside the text
+    for sentence in _iter_sentences(text):
+        if current_len + len(sentence) > max_chars:
+            if current_len:
+                chunks.append(" ".join(current_chunk).strip())
+            current_chunk = [sentence]
+            current_len = len(sentence)
         else:
-            current_chunk += " " + sentence
+            current_chunk.append(sentence)
+            current_len += 1 + len(sentence)
 
-    if current_chunk:
-        chunks.append(current_chunk.strip())
+    if current_len:
+        chunks.append(" ".join(current_chunk).strip())
 
     return chunks
 
@@ -353,23 +575,40 @@ def summarize_transcript(
     transcript: Transcript,
     model: Optional[str] = None,
     rate_limit: bool = True,
+    use_cache: bool = True,
 ) -> PodcastSummary:
     """
     Generate a structured summary from a podcast transcript.
 
+    An identical transcript and prompt summarized with the same model is
+    served from a content-hash cache instead of calling the LLM again.
+
     Args:
         episode: Episode metadata
         transcript: Transcript object with full text
-        model: Model alias (e.g., 'sonnet', 'haiku', 'gpt-4o'). Defaults to DEFAULT_MODEL.
+        model: Model alias (e.g., 'sonnet', 'haiku', 'gpt-4o'). Defaults to get_default_model().
         rate_limit: Whether to apply rate limiting (default True)
+        use_cache: Whether to reuse a summary of identical prompt inputs
 
     Returns:
         PodcastSummary object
     """
-    model = model or DEFAULT_MODEL
+    model = model or get_default_model()
 
     # Validate model
-    get_model_info(model)  # Raises if invalid
+    _, model_id = get_model_info(model)  # Raises if invalid
+
+    cache_key = _summary_cache_key(
+        transcript.text, model_id,
+        podcast_name=episode.podcast_name,
+        episode_title=episode.title,
+        host=episode.podcast_author or "Unknown",
+        duration=episode.duration_formatted,
+    )
+    if use_cache:
+        cached = _load_hashed_summary(cache_key)
+        if cached:
+            return cached
 
     # Set rate limiting
     set_rate_limiting(rate_limit)
@@ -379,10 +618,13 @@ def summarize_transcript(
 
     if len(chunks) == 1:
         # Single chunk - process directly
-        return _summarize_single(episode, transcript.text, model)
+        summary = _summarize_single(episode, transcript.text, model)
     else:
         # Multiple chunks - summarize each, then synthesize
-        return _summarize_chunked(episode, chunks, model)
+        summary = _summarize_chunked(episode, chunks, model)
+
+    _save_hashed_summary(cache_key, summary)
+    return summary
 
 
 def _summarize_single(
@@ -405,28 +647,9 @@ def _summarize_single(
     _apply_rate_limit(estimated_tokens)
 
     # Call LLM
-    response_text = _call_llm(prompt, model)
+    response_text = _call_llm(prompt, model, json_mode=True)
 
-    # Clean up response if needed (sometimes has markdown code blocks)
-    if response_text.startswith("```"):
-        response_text = response_text.split("```")[1]
-        if response_text.startswith("json"):
-            response_text = response_text[4:]
-    response_text = response_text.strip()
-
-    data = json.loads(response_text)
-
-    return PodcastSummary(
-        tldr=data.get("tldr", ""),
-        who_should_listen=data.get("who_should_listen", ""),
-        key_insights=data.get("key_insights", []),
-        frameworks=data.get("frameworks", []),
-        soundbites=data.get("soundbites", []),
-        takeaways=data.get("takeaways", []),
-        references=data.get("references", {"books": [], "people": [], "tools": [], "links": []}),
-        categories=data.get("categories", []),
-        guests=data.get("guests", []),
-    )
+    return _parse_summary_response(response_text)
 
 
 SYNTHESIS_PROMPT = """You are synthesizing summaries from a long podcast episode that was processed in chunks.
@@ -465,23 +688,20 @@ def _summarize_chunked(
     """Summarize multiple chunks and synthesize."""
 
     # Summarize each chunk
-    chunk_summaries = []
-    for i, chunk in enumerate(chunks):
-        prompt = EXTRACTION_PROMPT.format(
+    prompts = [
+        EXTRACTION_PROMPT.format(
             podcast_name=episode.podcast_name,
             episode_title=f"{episode.title} (Part {i+1}/{len(chunks)})",
             host=episode.podcast_author or "Unknown",
             duration=episode.duration_formatted,
             transcript=chunk,
         )
-
-        # Apply rate limiting for each chunk
-        estimated_tokens = _estimate_tokens(prompt)
-        _apply_rate_limit(estimated_tokens)
-
-        # Call LLM
-        response_text = _call_llm(prompt, model)
-        chunk_summaries.append(f"=== Part {i+1} ===\n{response_text}")
+        for i, chunk in enumerate(chunks)
+    ]
+    chunk_summaries = [
+        f"=== Part {i+1} ===\n{response_text}"
+        for i, response_text in enumerate(_call_llm_for_chunks(prompts, model))
+    ]
 
     # Synthesize
     synthesis_prompt = SYNTHESIS_PROMPT.format(
@@ -495,27 +715,9 @@ def _summarize_chunked(
     _apply_rate_limit(estimated_tokens)
 
     # Call LLM for synthesis
-    response_text = _call_llm(synthesis_prompt, model)
+    response_text = _call_llm(synthesis_prompt, model, json_mode=True)
 
-    if response_text.startswith("```"):
-        response_text = response_text.split("```")[1]
-        if response_text.startswith("json"):
-            response_text = response_text[4:]
-    response_text = response_text.strip()
-
-    data = json.loads(response_text)
-
-    return PodcastSummary(
-        tldr=data.get("tldr", ""),
-        who_should_listen=data.get("who_should_listen", ""),
-        key_insights=data.get("key_insights", []),
-        frameworks=data.get("frameworks", []),
-        soundbites=data.get("soundbites", []),
-        takeaways=data.get("takeaways", []),
-        references=data.get("references", {"books": [], "people": [], "tools": [], "links": []}),
-        categories=data.get("categories", []),
-        guests=data.get("guests", []),
-    )
+    return _parse_summary_response(response_text)
 
 
 # --- Standalone YouTube Video Summarization ---
@@ -525,25 +727,41 @@ def summarize_youtube_video(
     transcript_text: str,
     model: Optional[str] = None,
     rate_limit: bool = True,
+    use_cache: bool = True,
 ) -> PodcastSummary:
     """
     Summarize a standalone YouTube video (not tied to Apple Podcasts).
 
+    Shares the content-hash cache with summarize_transcript.
+
     Args:
         video: YouTubeVideo object with video metadata
         transcript_text: Full transcript text
-        model: Model alias (e.g., 'sonnet', 'haiku'). Defaults to DEFAULT_MODEL.
+        model: Model alias (e.g., 'sonnet', 'haiku'). Defaults to get_default_model().
         rate_limit: Whether to apply rate limiting (default True)
+        use_cache: Whether to reuse a summary of identical prompt inputs
 
     Returns:
         PodcastSummary object
     """
     from .youtube import YouTubeVideo  # Import here to avoid circular import
 
-    model = model or DEFAULT_MODEL
+    model = model or get_default_model()
 
     # Validate model
-    get_model_info(model)  # Raises if invalid
+    _, model_id = get_model_info(model)  # Raises if invalid
+
+    cache_key = _summary_cache_key(
+        transcript_text, model_id,
+        podcast_name=video.channel,
+        episode_title=video.title,
+        host=video.channel,
+        duration=video.duration_formatted,
+    )
+    if use_cache:
+        cached = _load_hashed_summary(cache_key)
+        if cached:
+            return cached
 
     # Set rate limiting
     set_rate_limiting(rate_limit)
@@ -552,9 +770,12 @@ def summarize_youtube_video(
     chunks = chunk_transcript(transcript_text)
 
     if len(chunks) == 1:
-        return _summarize_youtube_single(video, transcript_text, model)
+        summary = _summarize_youtube_single(video, transcript_text, model)
     else:
-        return _summarize_youtube_chunked(video, chunks, model)
+        summary = _summarize_youtube_chunked(video, chunks, model)
+
+    _save_hashed_summary(cache_key, summary)
+    return summary
 
 
 def _summarize_youtube_single(
@@ -578,28 +799,9 @@ def _summarize_youtube_single(
     _apply_rate_limit(estimated_tokens)
 
     # Call LLM
-    response_text = _call_llm(prompt, model)
+    response_text = _call_llm(prompt, model, json_mode=True)
 
-    # Clean up response if needed (sometimes has markdown code blocks)
-    if response_text.startswith("```"):
-        response_text = response_text.split("```")[1]
-        if response_text.startswith("json"):
-            response_text = response_text[4:]
-    response_text = response_text.strip()
-
-    data = json.loads(response_text)
-
-    return PodcastSummary(
-        tldr=data.get("tldr", ""),
-        who_should_listen=data.get("who_should_listen", ""),
-        key_insights=data.get("key_insights", []),
-        frameworks=data.get("frameworks", []),
-        soundbites=data.get("soundbites", []),
-        takeaways=data.get("takeaways", []),
-        references=data.get("references", {"books": [], "people": [], "tools": [], "links": []}),
-        categories=data.get("categories", []),
-        guests=data.get("guests", []),
-    )
+    return _parse_summary_response(response_text)
 
 
 def _summarize_youtube_chunked(
@@ -611,23 +813,20 @@ def _summarize_youtube_chunked(
     from .youtube import YouTubeVideo  # Import here to avoid circular import
 
     # Summarize each chunk
-    chunk_summaries = []
-    for i, chunk in enumerate(chunks):
-        prompt = EXTRACTION_PROMPT.format(
+    prompts = [
+        EXTRACTION_PROMPT.format(
             podcast_name=video.channel,
             episode_title=f"{video.title} (Part {i+1}/{len(chunks)})",
             host=video.channel,
             duration=video.duration_formatted,
             transcript=chunk,
         )
-
-        # Apply rate limiting for each chunk
-        estimated_tokens = _estimate_tokens(prompt)
-        _apply_rate_limit(estimated_tokens)
-
-        # Call LLM
-        response_text = _call_llm(prompt, model)
-        chunk_summaries.append(f"=== Part {i+1} ===\n{response_text}")
+        for i, chunk in enumerate(chunks)
+    ]
+    chunk_summaries = [
+        f"=== Part {i+1} ===\n{response_text}"
+        for i, response_text in enumerate(_call_llm_for_chunks(prompts, model))
+    ]
 
     # Synthesize
     synthesis_prompt = SYNTHESIS_PROMPT.format(
@@ -641,27 +840,9 @@ def _summarize_youtube_chunked(
     _apply_rate_limit(estimated_tokens)
 
     # Call LLM for synthesis
-    response_text = _call_llm(synthesis_prompt, model)
+    response_text = _call_llm(synthesis_prompt, model, json_mode=True)
 
-    if response_text.startswith("```"):
-        response_text = response_text.split("```")[1]
-        if response_text.startswith("json"):
-            response_text = response_text[4:]
-    response_text = response_text.strip()
-
-    data = json.loads(response_text)
-
-    return PodcastSummary(
-        tldr=data.get("tldr", ""),
-        who_should_listen=data.get("who_should_listen", ""),
-        key_insights=data.get("key_insights", []),
-        frameworks=data.get("frameworks", []),
-        soundbites=data.get("soundbites", []),
-        takeaways=data.get("takeaways", []),
-        references=data.get("references", {"books": [], "people": [], "tools": [], "links": []}),
-        categories=data.get("categories", []),
-        guests=data.get("guests", []),
-    )
+    return _parse_summary_response(response_text)
 
 
 if __name__ == "__main__":
@@ -672,6 +853,7 @@ if __name__ == "__main__":
     print("Testing summarization...")
 
     # Check for API key
+    load_env()
     api_key = os.getenv("ANTHROPIC_API_KEY")
     if not api_key:
         print("\nError: ANTHROPIC_API_KEY not set.")
@@ -685,8 +867,7 @@ if __name__ == "__main__":
         exit(1)
 
     # Load first cached transcript
-    with open(cache_files[0]) as f:
-        data = json.load(f)
+    data = _json_loads(cache_files[0].read_bytes())
 
     episode_id = data["episode_id"]
 
@@ -1,17 +1,57 @@
 """
 Flask application factory for Podcastwise web UI.
 
-Run with: python -m src.web.app
+Run with: python -m src.web.app (debug server)
+Serve with: python -m src.web.wsgi, or gunicorn -k gevent -w 1 src.web.wsgi:app
 """
 
 import os
 from flask import Flask, render_template, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider that serializes jsonify() responses with orjson."""
+
+    def _orjson_dumps(self, obj) -> bytes:
+        # Datetimes go through self.default so they keep Flask's HTTP-date format
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj, **kwargs) -> str:
+        # orjson has no indent/separators options; use json for custom formatting
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return self._orjson_dumps(obj).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            return super().response(*args, **kwargs)  # Indented output
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            self._orjson_dumps(obj) + b"\n", mimetype=self.mimetype
+        )
 
 
 def create_app():
     """Create and configure the Flask application."""
+    from ..summarizer import load_env
+    load_env()  # Output dir and API keys may come from .env
+
     app = Flask(__name__)
     app.secret_key = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
+    if orjson is not None:
+        app.json = ORJSONProvider(app)
 
     # Register blueprints
     from .routes import shows, episodes, processing, export
@@ -35,4 +75,5 @@ if __name__ == '__main__':
     print("  Podcastwise Web UI")
     print("  http://localhost:5000")
     print("=" * 50 + "\n")
-    app.run(debug=True, port=5000)
+    # Threaded, so a slow request doesn't block the others
+    app.run(debug=True, port=5000, threaded=True)
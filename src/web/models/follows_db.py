@@ -4,7 +4,9 @@ SQLite database for followed shows and RSS episodes.
 Database location: ~/Documents/PodcastNotes/.state/podcastwise.db
 """
 
+import json
 import sqlite3
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -16,16 +18,44 @@ DB_DIR = Path.home() / "Documents/PodcastNotes/.state"
 DB_PATH = DB_DIR / "podcastwise.db"
 
 
+# One connection per thread, reused across queries
+_local = threading.local()
+_schema_lock = threading.Lock()
+_schema_initialized = False
+
+
 def get_connection() -> sqlite3.Connection:
-    """Get a database connection, creating the database if needed."""
+    """
+    Get this thread's database connection, creating the database if needed.
+
+    The connection is opened once per thread and reused; callers must not close it.
+    """
+    global _schema_initialized
+
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        return conn
+
     DB_DIR.mkdir(parents=True, exist_ok=True)
 
     conn = sqlite3.connect(DB_PATH)
     conn.row_factory = sqlite3.Row
+    # WAL lets readers run alongside a writer; NORMAL sync is safe under WAL
+    conn.executescript("""
+        PRAGMA journal_mode = WAL;
+        PRAGMA synchronous = NORMAL;
+        PRAGMA temp_store = MEMORY;
+    """)
 
-    # Initialize schema if needed
-    _init_schema(conn)
+    # Initialize schema once per process
+    with _schema_lock:
+        if not _schema_initialized:
+            _init_schema(conn)
+            # Refresh planner statistics so the index choices stay good
+            conn.execute("PRAGMA optimize")
+            _schema_initialized = True
 
+    _local.conn = conn
     return conn
 
 
@@ -36,7 +66,9 @@ def _init_schema(conn: sqlite3.Connection) -> None:
             id INTEGER PRIMARY KEY,
             podcast_name TEXT NOT NULL UNIQUE,
             feed_url TEXT,
-            last_rss_fetch TIMESTAMP
+            last_rss_fetch TIMESTAMP,
+            etag TEXT,
+            last_modified TEXT
         );
 
         CREATE TABLE IF NOT EXISTS rss_episodes (
@@ -51,7 +83,16 @@ def _init_schema(conn: sqlite3.Connection) -> None:
         );
 
         CREATE INDEX IF NOT EXISTS idx_rss_episodes_show ON rss_episodes(show_id);
+        CREATE INDEX IF NOT EXISTS idx_rss_episodes_show_guid ON rss_episodes(show_id, guid);
+        CREATE INDEX IF NOT EXISTS idx_rss_episodes_date ON rss_episodes(date_published DESC);
+        CREATE INDEX IF NOT EXISTS idx_rss_episodes_show_date ON rss_episodes(show_id, date_published DESC);
     """)
+
+    # Add feed cache header columns to databases created before they existed
+    columns = {row['name'] for row in conn.execute("PRAGMA table_info(followed_shows)")}
+    for column in ("etag", "last_modified"):
+        if column not in columns:
+            conn.execute(f"ALTER TABLE followed_shows ADD COLUMN {column} TEXT")
     conn.commit()
 
 
@@ -63,6 +104,9 @@ class FollowedShow:
     feed_url: Optional[str]
     last_rss_fetch: Optional[datetime]
     rss_episode_count: int = 0
+    # Validators from the last feed response, sent back for conditional GETs
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
 
     def to_dict(self) -> dict:
         return {
@@ -131,7 +175,6 @@ def get_followed_shows() -> list[FollowedShow]:
             rss_episode_count=row['rss_count']
         ))
 
-    conn.close()
     return shows
 
 
@@ -141,12 +184,11 @@ def get_followed_show(show_id: int) -> Optional[FollowedShow]:
     cursor = conn.cursor()
 
     cursor.execute("""
-        SELECT id, podcast_name, feed_url, last_rss_fetch
+        SELECT id, podcast_name, feed_url, last_rss_fetch, etag, last_modified
         FROM followed_shows WHERE id = ?
     """, (show_id,))
 
     row = cursor.fetchone()
-    conn.close()
 
     if not row:
         return None
@@ -162,7 +204,9 @@ def get_followed_show(show_id: int) -> Optional[FollowedShow]:
         id=row['id'],
         podcast_name=row['podcast_name'],
         feed_url=row['feed_url'],
-        last_rss_fetch=last_fetch
+        last_rss_fetch=last_fetch,
+        etag=row['etag'],
+        last_modified=row['last_modified'],
     )
 
 
@@ -184,7 +228,6 @@ def add_followed_show(podcast_name: str, feed_url: Optional[str] = None) -> Foll
     """, (podcast_name,))
 
     row = cursor.fetchone()
-    conn.close()
 
     return FollowedShow(
         id=row['id'],
@@ -201,43 +244,54 @@ def remove_followed_show(show_id: int) -> None:
 
     cursor.execute("DELETE FROM followed_shows WHERE id = ?", (show_id,))
     conn.commit()
-    conn.close()
 
 
 def update_feed_url(show_id: int, feed_url: str) -> None:
-    """Update the feed URL for a followed show."""
+    """Update the feed URL for a followed show (dropping the old feed's cache headers)."""
     conn = get_connection()
     cursor = conn.cursor()
 
     cursor.execute("""
-        UPDATE followed_shows SET feed_url = ? WHERE id = ?
+        UPDATE followed_shows SET feed_url = ?, etag = NULL, last_modified = NULL WHERE id = ?
     """, (feed_url, show_id))
     conn.commit()
-    conn.close()
 
 
-def update_last_fetch(show_id: int) -> None:
-    """Update the last RSS fetch timestamp."""
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        UPDATE followed_shows SET last_rss_fetch = ? WHERE id = ?
-    """, (datetime.now().isoformat(), show_id))
-    conn.commit()
-    conn.close()
-
+def touch_show(
+    show_id: int,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+) -> None:
+    """
+    Record an RSS fetch for a followed show in a single UPDATE.
 
-def add_rss_episode(episode: RSSEpisode) -> None:
-    """Add an RSS episode to the database."""
+    Args:
+        show_id: Followed show ID
+        etag: ETag of the feed response, or None to keep the current one
+        last_modified: Last-Modified of the feed response, or None to keep the current one
+    """
     conn = get_connection()
-    cursor = conn.cursor()
+    with conn:
+        # Local time, matching the datetime.now() values written previously
+        conn.execute("""
+            UPDATE followed_shows
+            SET etag = COALESCE(?, etag),
+                last_modified = COALESCE(?, last_modified),
+                last_rss_fetch = datetime('now', 'localtime')
+            WHERE id = ?
+        """, (etag, last_modified, show_id))
+
+
+_INSERT_RSS_EPISODE = """
+    INSERT OR REPLACE INTO rss_episodes
+    (id, show_id, guid, title, description, duration_seconds, date_published, audio_url)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
 
-    cursor.execute("""
-        INSERT OR REPLACE INTO rss_episodes
-        (id, show_id, guid, title, description, duration_seconds, date_published, audio_url)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
+
+def _rss_episode_row(episode: RSSEpisode) -> tuple:
+    """Convert an RSSEpisode to rss_episodes column values."""
+    return (
         episode.id,
         episode.show_id,
         episode.guid,
@@ -246,25 +300,67 @@ def add_rss_episode(episode: RSSEpisode) -> None:
         episode.duration_seconds,
         episode.date_published.isoformat() if episode.date_published else None,
         episode.audio_url
-    ))
+    )
+
+
+def add_rss_episode(episode: RSSEpisode) -> None:
+    """Add an RSS episode to the database."""
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    cursor.execute(_INSERT_RSS_EPISODE, _rss_episode_row(episode))
     conn.commit()
-    conn.close()
 
 
-def get_rss_episodes(show_id: Optional[int] = None) -> list[RSSEpisode]:
-    """Get RSS episodes, optionally filtered by show."""
+def add_rss_episodes(episodes: list[RSSEpisode]) -> None:
+    """Add RSS episodes to the database in a single transaction."""
+    if not episodes:
+        return
+
+    conn = get_connection()
+    with conn:
+        conn.executemany(_INSERT_RSS_EPISODE, [_rss_episode_row(ep) for ep in episodes])
+
+
+def get_rss_episodes(
+    show_id: Optional[int] = None,
+    *,
+    show_ids: Optional[list[int]] = None,
+    episode_ids: Optional[list[str]] = None,
+) -> list[RSSEpisode]:
+    """
+    Get RSS episodes, optionally filtered by show or episode ID.
+
+    Args:
+        show_id: Only include episodes of this show
+        show_ids: Only include episodes of these shows
+        episode_ids: Only include episodes with these IDs
+
+    Returns:
+        List of RSSEpisode objects, most recently published first
+    """
     conn = get_connection()
     cursor = conn.cursor()
 
+    conditions = []
+    params: list = []
     if show_id:
-        cursor.execute("""
-            SELECT * FROM rss_episodes WHERE show_id = ?
-            ORDER BY date_published DESC
-        """, (show_id,))
-    else:
-        cursor.execute("""
-            SELECT * FROM rss_episodes ORDER BY date_published DESC
-        """)
+        conditions.append("show_id = ?")
+        params.append(show_id)
+    # ID lists are bound as one JSON parameter, so their size is not limited
+    # by SQLite's host-parameter cap and the SQL text stays the same
+    if show_ids is not None:
+        conditions.append("show_id IN (SELECT value FROM json_each(?))")
+        params.append(json.dumps(list(show_ids)))
+    if episode_ids is not None:
+        conditions.append("id IN (SELECT value FROM json_each(?))")
+        params.append(json.dumps(list(episode_ids)))
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    cursor.execute(f"""
+        SELECT * FROM rss_episodes {where}
+        ORDER BY date_published DESC
+    """, params)
 
     episodes = []
     for row in cursor.fetchall():
@@ -286,7 +382,6 @@ def get_rss_episodes(show_id: Optional[int] = None) -> list[RSSEpisode]:
             audio_url=row['audio_url']
         ))
 
-    conn.close()
     return episodes
 
 
@@ -300,5 +395,12 @@ def episode_exists(guid: str, show_id: int) -> bool:
     """, (guid, show_id))
 
     exists = cursor.fetchone() is not None
-    conn.close()
     return exists
+
+
+def existing_guids(show_id: int) -> set[str]:
+    """Get the guids of all RSS episodes stored for a show."""
+    cursor = get_connection().execute("""
+        SELECT guid FROM rss_episodes WHERE show_id = ?
+    """, (show_id,))
+    return {row[0] for row in cursor}
@@ -64,6 +64,7 @@ def get_unified_episodes(
     source: Optional[str] = None,
     limit: Optional[int] = None,
     episode_ids: Optional[list[str]] = None,
+    apple_episodes: Optional[list] = None,
 ) -> list[UnifiedEpisode]:
     """
     Get unified episodes from both Apple Podcasts and RSS sources.
@@ -74,6 +75,8 @@ def get_unified_episodes(
         source: 'apple', 'rss'
         limit: Maximum number of episodes
         episode_ids: Specific episode IDs to fetch
+        apple_episodes: Already-fetched get_episodes_since() result to reuse
+            instead of reading the Apple Podcasts database again
 
     Returns:
         List of UnifiedEpisode objects
@@ -85,22 +88,25 @@ def get_unified_episodes(
     state = get_state_manager()
     episodes = []
 
-    # Get processed episode IDs for status filtering
-    processed_map = {}
-    for pe in state.list_processed():
-        processed_map[str(pe.episode_id)] = pe.status
+    def status_of(episode_id) -> str:
+        # Direct lookup per returned episode instead of mapping the whole state
+        processed = state.get_processed(episode_id)
+        return processed.status if processed else 'new'
 
     # Fetch specific episodes by ID
     if episode_ids:
-        apple_ids = [int(id) for id in episode_ids if not id.startswith('rss_')]
+        apple_ids = {int(id) for id in episode_ids if not id.startswith('rss_')}
         rss_ids = [id for id in episode_ids if id.startswith('rss_')]
 
         # Fetch Apple episodes
         if apple_ids:
-            all_apple = get_episodes_since()
-            for ep in all_apple:
+            if apple_episodes is None:
+                apple_episodes = get_episodes_since(episode_ids=list(apple_ids))
+            for ep in apple_episodes:
+                if len(episodes) == len(apple_ids):
+                    break  # IDs are unique, so every requested episode is found
                 if ep.id in apple_ids:
-                    ep_status = processed_map.get(str(ep.id), 'new')
+                    ep_status = status_of(ep.id)
                     episodes.append(UnifiedEpisode(
                         id=str(ep.id),
                         title=ep.title,
@@ -115,24 +121,45 @@ def get_unified_episodes(
                         guid=ep.guid,
                     ))
 
-        # TODO: Fetch specific RSS episodes by ID
+        # Fetch RSS episodes
+        if rss_ids:
+            rss_episodes = get_rss_episodes(episode_ids=rss_ids)
+            shows_by_id = {s.id: s for s in get_followed_shows()} if rss_episodes else {}
+            for re in rss_episodes:
+                show_info = shows_by_id.get(re.show_id)
+                if not show_info:
+                    continue
+                episodes.append(UnifiedEpisode(
+                    id=re.id,
+                    title=re.title,
+                    podcast_name=show_info.podcast_name,
+                    source='rss',
+                    status=status_of(re.id),
+                    description=re.description,
+                    duration_seconds=re.duration_seconds,
+                    date_published=re.date_published,
+                    feed_url=show_info.feed_url,
+                    audio_url=re.audio_url,
+                    guid=re.guid,
+                ))
+
         return episodes
 
     # Fetch from Apple Podcasts if not filtering to RSS only
     if source != 'rss':
         try:
-            apple_episodes = get_episodes_since()
+            # Show filter runs in SQL unless the episodes were passed in
+            if apple_episodes is None:
+                apple_episodes = get_episodes_since(podcast_name=show or None)
+            elif show:
+                apple_episodes = [ep for ep in apple_episodes if ep.podcast_name == show]
             for ep in apple_episodes:
-                ep_status = processed_map.get(str(ep.id), 'new')
+                ep_status = status_of(ep.id)
 
                 # Apply status filter
                 if status and ep_status != status:
                     continue
 
-                # Apply show filter
-                if show and ep.podcast_name != show:
-                    continue
-
                 episodes.append(UnifiedEpisode(
                     id=str(ep.id),
                     title=ep.title,
@@ -152,31 +179,24 @@ def get_unified_episodes(
     # Fetch from RSS if not filtering to Apple only
     if source != 'apple':
         try:
-            # Get show name to ID mapping
-            followed = {s.podcast_name: s for s in get_followed_shows()}
+            # Followed shows by ID, narrowed to the show filter up front
+            shows_by_id = {
+                s.id: s for s in get_followed_shows()
+                if not show or s.podcast_name == show
+            }
 
-            rss_episodes = get_rss_episodes()
+            rss_episodes = get_rss_episodes(show_ids=list(shows_by_id) if show else None)
             for re in rss_episodes:
-                # Get podcast name from followed shows
-                show_info = None
-                for s in followed.values():
-                    if s.id == re.show_id:
-                        show_info = s
-                        break
-
+                show_info = shows_by_id.get(re.show_id)
                 if not show_info:
                     continue
 
-                ep_status = processed_map.get(re.id, 'new')
+                ep_status = status_of(re.id)
 
                 # Apply status filter
                 if status and ep_status != status:
                     continue
 
-                # Apply show filter
-                if show and show_info.podcast_name != show:
-                    continue
-
                 episodes.append(UnifiedEpisode(
                     id=re.id,
                     title=re.title,
@@ -57,11 +57,13 @@ def _run_processing(
             'total': len(episode_ids)
         })
 
+        # Read the Apple Podcasts database once for both lookups below
+        apple_episodes = get_episodes_since()
+
         # Get unified episodes
-        unified = get_unified_episodes(episode_ids=episode_ids)
+        unified = get_unified_episodes(episode_ids=episode_ids, apple_episodes=apple_episodes)
 
         # Map unified episodes back to Apple Podcast Episode objects for pipeline
-        apple_episodes = get_episodes_since()
         apple_map = {str(ep.id): ep for ep in apple_episodes}
 
         episodes_to_process = []
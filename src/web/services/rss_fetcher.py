@@ -5,6 +5,7 @@ Fetches new episodes from followed podcast RSS feeds.
 """
 
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from time import mktime
 from typing import Optional
@@ -14,6 +15,8 @@ try:
 except ImportError:
     feedparser = None
 
+RSS_SYNC_WORKERS = 8  # Feeds fetched concurrently by sync_all_feeds
+
 
 def fetch_episodes_for_show(show_id: int) -> dict:
     """
@@ -26,8 +29,8 @@ def fetch_episodes_for_show(show_id: int) -> dict:
         return {'error': 'feedparser not installed. Run: pip install feedparser'}
 
     from ..models.follows_db import (
-        get_followed_show, update_last_fetch, add_rss_episode,
-        episode_exists, RSSEpisode
+        get_followed_show, touch_show, add_rss_episodes,
+        existing_guids, RSSEpisode
     )
 
     show = get_followed_show(show_id)
@@ -38,19 +41,27 @@ def fetch_episodes_for_show(show_id: int) -> dict:
         return {'error': 'No feed URL configured for this show', 'new_episodes': 0}
 
     try:
-        feed = feedparser.parse(show.feed_url)
+        # Conditional GET: an unchanged feed answers 304 with no body
+        feed = feedparser.parse(show.feed_url, etag=show.etag, modified=show.last_modified)
+
+        if feed.get('status') == 304:
+            touch_show(show_id)
+            return {'new_episodes': 0}
 
         if feed.bozo and not feed.entries:
             return {'error': f'Failed to parse feed: {feed.bozo_exception}', 'new_episodes': 0}
 
-        new_count = 0
+        # One query for every stored guid instead of one lookup per entry
+        known_guids = existing_guids(show_id)
+
+        new_episodes = []
         for entry in feed.entries:
             guid = entry.get('id') or entry.get('link') or entry.get('title')
             if not guid:
                 continue
 
-            # Skip if already exists
-            if episode_exists(guid, show_id):
+            # Skip if already exists (or repeats an entry earlier in this feed)
+            if guid in known_guids:
                 continue
 
             # Parse duration
@@ -89,13 +100,16 @@ def fetch_episodes_for_show(show_id: int) -> dict:
                 audio_url=audio_url
             )
 
-            add_rss_episode(episode)
-            new_count += 1
+            new_episodes.append(episode)
+            known_guids.add(guid)
+
+        # Insert all new episodes in one transaction
+        add_rss_episodes(new_episodes)
 
-        # Update last fetch timestamp
-        update_last_fetch(show_id)
+        # Update last fetch timestamp and the validators for the next fetch
+        touch_show(show_id, etag=feed.get('etag'), last_modified=feed.get('modified'))
 
-        return {'new_episodes': new_count}
+        return {'new_episodes': len(new_episodes)}
 
     except Exception as e:
         return {'error': str(e), 'new_episodes': 0}
@@ -124,22 +138,28 @@ def parse_duration(duration_str: str) -> Optional[int]:
 
 
 def sync_all_feeds() -> dict:
-    """Sync all followed shows' RSS feeds."""
+    """
+    Sync all followed shows' RSS feeds.
+
+    Feeds are fetched concurrently; each worker thread uses its own
+    database connection (see follows_db.get_connection).
+    """
     from ..models.follows_db import get_followed_shows
 
-    shows = get_followed_shows()
+    shows = [s for s in get_followed_shows() if s.feed_url]
     total_new = 0
     errors = []
 
-    for show in shows:
-        if show.feed_url:
-            result = fetch_episodes_for_show(show.id)
-            total_new += result.get('new_episodes', 0)
-            if 'error' in result:
-                errors.append({'show': show.podcast_name, 'error': result['error']})
+    if shows:
+        with ThreadPoolExecutor(max_workers=min(RSS_SYNC_WORKERS, len(shows))) as executor:
+            results = executor.map(fetch_episodes_for_show, [s.id for s in shows])
+            for show, result in zip(shows, results):
+                total_new += result.get('new_episodes', 0)
+                if 'error' in result:
+                    errors.append({'show': show.podcast_name, 'error': result['error']})
 
     return {
         'total_new': total_new,
-        'shows_synced': len([s for s in shows if s.feed_url]),
+        'shows_synced': len(shows),
         'errors': errors
     }
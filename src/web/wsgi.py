@@ -0,0 +1,33 @@
+"""
+WSGI entry point for Podcastwise web UI.
+
+Run with a gevent worker so slow LLM calls, RSS refreshes and SSE streams
+don't hold up other requests:
+    gunicorn -k gevent -w 1 src.web.wsgi:app
+
+Or, with gevent installed: python -m src.web.wsgi
+"""
+
+if __name__ == '__main__':
+    # Patch blocking I/O before Flask, requests and sqlite3 are imported
+    try:
+        from gevent import monkey
+        monkey.patch_all()
+    except ImportError:
+        monkey = None
+
+from .app import create_app
+
+app = create_app()
+
+
+if __name__ == '__main__':
+    print("\n" + "=" * 50)
+    print("  Podcastwise Web UI")
+    print("  http://localhost:5000")
+    print("=" * 50 + "\n")
+    if monkey is not None:
+        from gevent.pywsgi import WSGIServer
+        WSGIServer(('127.0.0.1', 5000), app).serve_forever()
+    else:
+        app.run(port=5000, threaded=True)
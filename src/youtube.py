@@ -10,6 +10,7 @@ import os
 import re
 import hashlib
 import subprocess
+import threading
 import http.cookiejar
 from dataclasses import dataclass
 from datetime import datetime
@@ -230,7 +231,7 @@ class Transcript:
         }
 
         with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
 
         return cache_file
 
@@ -933,6 +934,10 @@ def fetch_transcript_for_episode(
     return transcript
 
 
+# Guards read-modify-write of the not-found file across pipeline workers
+_not_found_lock = threading.Lock()
+
+
 def get_not_found_file() -> Path:
     """Get not-found file path, evaluated at runtime."""
     return get_cache_dir() / "_not_found.json"
@@ -957,9 +962,10 @@ def save_not_found(episode_ids: set[int]) -> None:
 
 def mark_not_found(episode_id: int) -> None:
     """Mark an episode as having no transcript available."""
-    not_found = load_not_found()
-    not_found.add(episode_id)
-    save_not_found(not_found)
+    with _not_found_lock:
+        not_found = load_not_found()
+        not_found.add(episode_id)
+        save_not_found(not_found)
 
 
 def is_not_found(episode_id: int) -> bool:
@@ -969,9 +975,10 @@ def is_not_found(episode_id: int) -> bool:
 
 def clear_not_found(episode_id: int) -> None:
     """Remove an episode from the not-found list (for retry)."""
-    not_found = load_not_found()
-    not_found.discard(episode_id)
-    save_not_found(not_found)
+    with _not_found_lock:
+        not_found = load_not_found()
+        not_found.discard(episode_id)
+        save_not_found(not_found)
 
 
 def clear_not_found_matching(episode_ids: list[int]) -> int: